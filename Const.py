@@ -31,14 +31,64 @@
 #                   |                | added function fromScipy()
 #                   |                |
 
-import math
+import functools
 import scipy
-from PObjects import PObject
-import classutilities
+from PObjects import PObject, SI
+
+__all__ = ['Const']
+
+
+@functools.lru_cache( maxsize=None )
+def _fromScipy( name ):
+    """!
+    @brief Look up a scipy constant only once per name.
+
+    The unit is returned as an SI.Unit since scipy's unit strings, such as
+    "mol^-1", cannot carry SI prefixes.  Units never change, so all PObjects
+    created for the constant can share it.
+    @param name name of constant as used in scipy.physical_constants
+    @return tuple with value, SI.Unit, and precision of the constant
+    """
+    value, unit, precision = scipy.constants.physical_constants[name]
+    return value, SI.Unit( unit ), precision
+
+
+
+class _ConstMeta( type ):
+    """!
+    @brief Metaclass providing the mnemonic names of the constants as class
+    attributes of Const.
+
+    PObjects can be changed in place, so every access creates a new PObject
+    for the constant; changing it cannot change the constant for anybody else.
+    """
+
+    def __getattr__( cls, name ):
+        """!
+        @brief Obtain a constant by its mnemonic name.
+        @param name mnemonic name of the constant
+        @return constant as a new PObject (including value and unit)
+        """
+        try:
+            scipyName = _scipyNames[name]
+        except KeyError:
+            raise AttributeError( "type object '{0}' has no attribute '{1}'"
+                                  .format( cls.__name__, name ) ) from None
+        return cls.fromScipy( scipyName )
+
+
+    def __dir__( cls ):
+        """!
+        @brief List the attributes of Const including the constants.
+        @return sorted list of attribute names
+        """
+        return sorted( set( super().__dir__() ) | set( _scipyNames ) )
+
+
 
 # Physical Constants:
 
-class Const( classutilities.ClassPropertiesMixin ):
+class Const( metaclass=_ConstMeta ):
     """!
     @brief Physical constants class.
 
@@ -83,6 +133,14 @@ class Const( classutilities.ClassPropertiesMixin ):
     print( Const.hbar )
     @endcode
     will produce the string "1.05457e-34 m**2 kg / s".
+
+    Every access to a constant returns a new PObject, so, e.g.,
+    @code
+    x = Const.c_0
+    x *= 2
+    @endcode
+    leaves Const.c_0 unchanged.  The values themselves are looked up in scipy
+    only once per constant.
     """
     
     @staticmethod
@@ -92,112 +150,26 @@ class Const( classutilities.ClassPropertiesMixin ):
         @param name name of constant as used in scipy.physical_constants
         @return constant as a PObject (including value and unit)
         """
-        return PObject( scipy.constants.physical_constants[name][0],
-                        scipy.constants.physical_constants[name][1],
-                        precision=scipy.constants.physical_constants[name][2] )
-                        
-    @classutilities.classproperty
-    def e_0( cls ):
-        """!
-        @brief elementary charge
-        """
-        return Const.fromScipy( 'elementary charge' )
-
-    @classutilities.classproperty
-    def m_e( cls ):
-        """!
-        @brief electron mass
-        """
-        return Const.fromScipy( 'electron mass' )
-
-    @classutilities.classproperty
-    def amu( cls ):
-        """!
-        @brief atomic mass unit
-        """
-        return Const.fromScipy( 'atomic mass constant' )
-
-    @classutilities.classproperty
-    def m_p( cls ):
-        """!
-        @brief proton mass
-        """
-        return Const.fromScipy( 'proton mass' )
-
-    @classutilities.classproperty
-    def m_n( cls ):
-        """!
-        @brief neutron mass
-        """
-        return Const.fromScipy( 'neutron mass' )
-
-    @classutilities.classproperty
-    def c_0( cls ):
-        """!
-        @brief speed of light in vacuum
-        """
-        return Const.fromScipy( 'speed of light in vacuum' )
-
-    @classutilities.classproperty
-    def h( cls ):
-        """!
-        @brief Planck's constant
-        """
-        return Const.fromScipy( 'Planck constant' )
-
-    @classutilities.classproperty
-    def hbar( cls ):
-        """!
-        @brief Planck's constant divided by 2 pi
-        """
-        return Const.h / (2. * math.pi)
-
-    @classutilities.classproperty
-    def N_A( cls ):
-        """!
-        @brief Avogadro's number
-        """
-        return Const.fromScipy( 'Avogadro constant' )
-
-    @classutilities.classproperty
-    def R( cls ):
-        """!
-        @brief general gas constant
-        """
-        return Const.fromScipy( 'molar gas constant' )
-
-    @classutilities.classproperty
-    def k_B( cls ):
-        """!
-        @brief Boltzmann constant
-        """
-        return Const.R / Const.N_A
-
-    @classutilities.classproperty
-    def G( cls ):
-        """!
-        @brief gravitational constant
-        """
-        return Const.fromScipy( 'Newton constant of gravitation' )
-
-    @classutilities.classproperty
-    def g( cls ):
-        """!
-        @brief acceleration at equator and sea level due to gravity -
-               this is not really a "constant" but often needed anyway
-        """
-        return Const.fromScipy( 'standard acceleration of gravity' )
-
-    @classutilities.classproperty
-    def mu_0( cls ):
-        """!
-        @brief Vacuum magnetic permeability
-        """
-        return Const.fromScipy( 'vacuum mag. permeability' )
-
-    @classutilities.classproperty
-    def epsilon_0( cls ):
-        """!
-        @brief Vacuum electric permittivity
-        """
-        return Const.fromScipy( 'vacuum electric permittivity' )
+        value, unit, precision = _fromScipy( name )
+        return PObject( value, unit, precision=precision )
+
+
+
+# mnemonic names of the constants in Const and their names in scipy
+_scipyNames = {
+    "e_0": "elementary charge",
+    "m_e": "electron mass",
+    "amu": "atomic mass constant",
+    "m_p": "proton mass",
+    "m_n": "neutron mass",
+    "c_0": "speed of light in vacuum",
+    "h": "Planck constant",
+    "hbar": "reduced Planck constant",
+    "N_A": "Avogadro constant",
+    "R": "molar gas constant",
+    "k_B": "Boltzmann constant",
+    "G": "Newtonian constant of gravitation",
+    "g": "standard acceleration of gravity",
+    "mu_0": "vacuum mag. permeability",
+    "epsilon_0": "vacuum electric permittivity"
+    }
@@ -31,14 +31,118 @@
 #                   |                |
 
 import math
+import bisect
 
 from PObjects import PObject, ESeries, EEObject, Resistor, Capacitor, Inductor
 
+__all__ = ['Erange', 'Rrange', 'Crange', 'Lrange']
+
+
+# decade factors 10**-30 through 10**30 - enough for all SI prefixes
+_decades = [10.0**k for k in range( -30, 31 )]
+
+
+def _decadeFactor( exponent ):
+    """!
+    @brief Obtain the factor 10**exponent for a decade.
+
+    Looking the factor up in a table avoids computing powers and accumulating
+    rounding errors by multiplying or dividing by 10 from decade to decade.
+    @param exponent integer exponent of the decade
+    @return 10**exponent as float
+    """
+    if -30 <= exponent <= 30:
+        return _decades[exponent + 30]
+    return 10.0**exponent
+
+
+def _bestSeries( start, end ):
+    """!
+    @brief Obtain the better of the series of the start and end objects.
+
+    The (common) case of start and end using the same series does not need to
+    be resolved by ESeries.bestOf().
+    @param start EEObject the iteration starts with
+    @param end EEObject the iteration ends with
+    @return series to use for the iteration
+    """
+    startSeries = start.series
+    endSeries = end.series
+    if startSeries == endSeries:
+        return startSeries
+    return ESeries.bestOf( startSeries, endSeries )
+
+
+def _seriesValues( start, end, elist ):
+    """!
+    @brief Generate the values of a series from the closest value to start to
+    the closest value to end.
+
+    The values are only computed as they are requested, so open-ended ranges,
+    of which only the first few values are used, are fine.
+    @param start beginning value for iteration
+    @param end ending value for iteration
+    @param elist list with the values of one decade of the series
+    @return generator of floats in iteration order
+    """
+    exponent = math.floor( math.log10( start ) )
+    last = len( elist ) - 1
+
+    # find index and decade for closest value in given series - the
+    # closest value is either the one just below or just above start
+    index = bisect.bisect_left( elist, start / _decadeFactor( exponent ) )
+    if 0 == index:
+        lowIndex, lowExponent = last, exponent - 1
+    else:
+        lowIndex, lowExponent = index - 1, exponent
+    if index > last:
+        highIndex, highExponent = 0, exponent + 1
+    else:
+        highIndex, highExponent = index, exponent
+    if abs( start - elist[highIndex] * _decadeFactor( highExponent ) ) < \
+       abs( start - elist[lowIndex] * _decadeFactor( lowExponent ) ):
+        index, exponent = highIndex, highExponent
+    else:
+        index, exponent = lowIndex, lowExponent
+
+    # walk through the series in the appropriate direction until the distance
+    # to the end value increases again
+    distance = math.inf
+    factor = _decadeFactor( exponent )
+    if start <= end:
+        while True:
+            value = elist[index] * factor
+            newDistance = abs( end - value )
+            if newDistance > distance: break
+            distance = newDistance
+            yield value
+            index += 1
+            if index > last:
+                index = 0
+                exponent += 1
+                factor = _decadeFactor( exponent )
+    else:
+        while True:
+            value = elist[index] * factor
+            newDistance = abs( end - value )
+            if newDistance > distance: break
+            distance = newDistance
+            yield value
+            index -= 1
+            if index < 0:
+                index = last
+                exponent -= 1
+                factor = _decadeFactor( exponent )
+
+
 class ErangeIter():
     """!
     @brief Iterator class for Erange-derived objects.
     """
-    def __init__( self, start, end, Eclass, *args, **kwargs ):
+
+    __slots__ = ("__Eclass", "__args", "__kwargs", "__values")
+
+    def __init__( self, start, end, elist, Eclass, *args, **kwargs ):
         """!
         @brief Constructor for iterator class for the EEObject class.
 
@@ -47,6 +151,7 @@ class ErangeIter():
         start value.
         @param start beginning value for iteration
         @param end ending value for iteration
+        @param elist list with the values of one decade of the series
         @param Eclass class (not its object) to create objects from
         @param series keyword argument for series to use
         """
@@ -54,39 +159,11 @@ class ErangeIter():
             start = start.value
         if isinstance( end, PObject ):
             end = end.value
-        self.__end = end
         self.__Eclass = Eclass
         self.__args = args
         self.__kwargs = kwargs
-        self.__series = self.__kwargs["series"]
-        self.__list = ESeries.list( self.__series )
-
-        self.__distance = math.inf
-
-        self.__factor = 10**math.floor( math.log10( start ) )
-        self.__last = len( self.__list ) - 1
-
-        self.__forward = start <= self.__end
-
-        # find index and factor for closest value in given series
-        error = math.inf
-        for i,val in enumerate( self.__list ):
-            newError = abs( start - val * self.__factor )
-            if newError < error:
-                error = newError
-                self.__index = i
-
-        # handle boundary cases
-        if 0 == self.__index:
-            newError = abs( start - self.__list[-1] * self.__factor / 10 )
-            if newError < error:
-                self.__index = self.__last
-                self.__factor /= 10
-        elif self.__last == self.__index:
-            newError = abs( start - self.__list[0] * self.__factor * 10 )
-            if newError < error:
-                self.__index = 0
-                self.__factor *= 10
+
+        self.__values = _seriesValues( start, end, elist )
 
         return
 
@@ -111,27 +188,8 @@ class ErangeIter():
         @throws StopIteration exception when end is reached
         """
 
-        # first compute the potential next value
-        value = self.__list[self.__index] * self.__factor
-
-        # determine if we are done
-        # which is the case if the distance to the end value increases again
-        newDistance = abs( self.__end - value )
-        if newDistance > self.__distance:
-            raise StopIteration()
-        self.__distance = newDistance
-
-        # advance self.__index in appropriate direction
-        if self.__forward:
-            self.__index += 1
-            if self.__index > self.__last:
-                self.__index = 0
-                self.__factor *= 10
-        else:
-            self.__index -= 1
-            if self.__index < 0:
-                self.__index = self.__last
-                self.__factor /= 10
+        # StopIteration from the exhausted value list ends the iteration
+        value = next( self.__values )
 
         return self.__Eclass( value, *self.__args, **self.__kwargs )
 
@@ -146,6 +204,8 @@ class Erange():
     less than the start value, the iteration will be done in reverse order.
     """
 
+    __slots__ = ("__start", "__end", "__Eclass", "__args", "__kwargs", "__list")
+
     def __init__( self, start, end, *args, **kwargs ):
         """!
         @brief Constructor for iterable class.
@@ -162,15 +222,13 @@ class Erange():
             raise ValueError( "Erange needs at lest a unit as parameters")
         elif len( args ) < 2:
             self.__Eclass = EEObject
+            self.__args = args
         else:
             self.__Eclass = args[0]
             self.__args = args[1:]
-        self.__args = args
-        try:
-            _ = kwargs["series"]
-        except KeyError:
-            kwargs["series"] = "E12"
         self.__kwargs = kwargs
+        # the series does not change between iterations
+        self.__list = ESeries.list( kwargs.setdefault( "series", "E12" ) )
         return
 
 
@@ -179,10 +237,30 @@ class Erange():
         @brief Return iterator for Eseries class.
         @return iterator object
         """
-        return ErangeIter( self.__start, self.__end, self.__Eclass,
+        return ErangeIter( self.__start, self.__end, self.__list, self.__Eclass,
                            *self.__args, **self.__kwargs )
 
 
+    @property
+    def values( self ):
+        """!
+        @brief Obtain the values of the iteration as plain floats.
+
+        This is much faster than iterating over the objects for numerical code
+        that does not need the objects themselves.
+        """
+        start = self.__start
+        end = self.__end
+        if isinstance( start, PObject ):
+            start = start.value
+        if isinstance( end, PObject ):
+            end = end.value
+        if not math.isfinite( end ):
+            raise ValueError( "Cannot list the values of an open-ended "
+                              "range" )
+        return list( _seriesValues( start, end, self.__list ) )
+
+
 
 class Rrange( Erange ):
     """!
@@ -202,7 +280,7 @@ class Rrange( Erange ):
         @param series name of seris (defaults to best of start and end)
         """
         if series is None:
-            series = ESeries.bestOf( start.series, end.series )
+            series = _bestSeries( start, end )
         super().__init__( start, end, "Ω", series=series )
         return
 
@@ -226,7 +304,7 @@ class Crange( Erange ):
         @param series name of series (defaults to best of start and end)
         """
         if series is None:
-            series = ESeries.bestOf( start.series, end.series )
+            series = _bestSeries( start, end )
         super().__init__( start, end, "F", series=series )
         return
 
@@ -250,6 +328,6 @@ class Lrange( Erange ):
         @param series name of series (defaults to best of start and end)
         """
         if series is None:
-            series = ESeries.bestOf( start.series, end.series )
+            series = _bestSeries( start, end )
         super().__init__( start, end, "H", series=series )
         return
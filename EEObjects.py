@@ -30,11 +30,28 @@
 #   Tue Dec 17 2024 | Ekkehard Blanz | moved to PObjects
 #                   |                |
 
-import sys
-import os.path
-
 from PObjects import PObject, SI, ESeries
 
+__all__ = ['EEObject', 'Voltage', 'Current', 'Resistor', 'Capacitor',
+           'Inductor']
+
+
+def _valueUnitArgs( value, args, unit ):
+    """!
+    @brief Split the constructor arguments of the convenience classes below
+    into value, unit, and remaining arguments.
+    @param value valstr with value and unit or numerical value
+    @param args positional arguments following value
+    @param unit default unit if neither value nor args provide one
+    @return tuple with value, unit, and remaining positional arguments
+    """
+    if isinstance( value, str ):
+        value, unit = SI.Prefix.fromString( value )
+    elif len( args ) > 0:
+        unit = args[0]
+        args = args[1:]
+    return value, unit, args
+
 
 class EEObject( PObject ):
     """!
@@ -49,6 +66,8 @@ class EEObject( PObject ):
     their values are not restricted and allow full precision computations.
     """
 
+    __slots__ = ("__series",)
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor.  Can be called as
@@ -78,15 +97,9 @@ class EEObject( PObject ):
                       digits=<digits> (default: 3),
                       strictAscii=<bool> (default: False)
         """
-        try:
-            self.__series = kwargs["series"]
-        except KeyError:
-            self.__series = "E12"
-        try:
-            _ = kwargs["digits"]
-        except KeyError:
-            kwargs["digits"] = 3
-            
+        self.__series = kwargs.get( "series", "E12" )
+        kwargs.setdefault( "digits", 3 )
+
         if isinstance( value, str ):
             if len( args ) != 0:
                 raise ValueError( "Too many arguments" )
@@ -111,9 +124,7 @@ class EEObject( PObject ):
         object.
         @return object with next higher value from same series
         """
-        return self.__class__( ESeries.next( self.value, self.series ),
-                               *self._args,
-                               **self._kwargs )
+        return self._fromSeriesValue( ESeries.next( self.value, self.series ) )
 
 
     def previous( self ):
@@ -122,8 +133,8 @@ class EEObject( PObject ):
         object.
         @return object with next lower value from same series
         """
-        return self.__class__( ESeries.previous( self.value, self.series ),
-                               *self._args, **self._kwargs )
+        return self._fromSeriesValue( ESeries.previous( self.value,
+                                                        self.series ) )
 
 
     def decade( self, decades=1, sorted=False, reverse=False ):
@@ -136,10 +147,23 @@ class EEObject( PObject ):
         """
         vlist = ESeries.decade( self.value, self.series, decades=decades,
                                 sorted=sorted, reverse=reverse )
-        olist = []
-        for value in vlist:
-            olist.append( self.__class__( value, *self._args, **self._kwargs ) )
-        return olist
+        return [self._fromSeriesValue( value ) for value in vlist]
+
+
+    def _fromSeriesValue( self, value ):
+        """!
+        @brief Create an object of the same class, unit, and series as this
+        one with a value that is already in the series.
+
+        Since the value does not need to be approximated by the series and the
+        unit is known, the constructors of the derived classes are bypassed.
+        @param value value out of the series of this object
+        @return new object with given value
+        """
+        obj = self.__class__.__new__( self.__class__ )
+        PObject.__init__( obj, value, self.unit, *self._args, **self._kwargs )
+        obj.__series = self.__series
+        return obj
 
 
     # inherits value and unit property from PObject
@@ -159,6 +183,8 @@ class Voltage( PObject ):
     @brief Convenience class to create a PObject-derived object with unit V.
     """
 
+    __slots__ = ()
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor.
@@ -168,21 +194,12 @@ class Voltage( PObject ):
         @param kwargs digits=<digits> (default: 3),
                       strictAscii=<bool> (default: False)
         """
-        try:
-            _ = kwargs["digits"]
-        except KeyError:
-            kwargs["digits"] = 3
+        kwargs.setdefault( "digits", 3 )
 
         if isinstance( value, PObject ):
             super().__init__( value, *args, **kwargs )
         else:
-            if str == type( value ):
-                value, unit = SI.Prefix.fromString( value )
-            elif len( args ) > 0:
-                unit = args[0]
-                args = args[1:]
-            else:
-                unit = "V"
+            value, unit, args = _valueUnitArgs( value, args, "V" )
             super().__init__( value, unit, *args, **kwargs )
         if self.unit != "V":
             raise ValueError( "Voltage can only be initialized with a "
@@ -197,6 +214,8 @@ class Current( PObject ):
     @brief Convenience class to create a PObject-derived object with unit A.
     """
 
+    __slots__ = ()
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor.
@@ -206,21 +225,12 @@ class Current( PObject ):
         @param kwargs digits=<digits> (default: 3),
                       strictAscii=<bool> (default: False)
         """
-        try:
-            _ = kwargs["digits"]
-        except KeyError:
-            kwargs["digits"] = 3
+        kwargs.setdefault( "digits", 3 )
 
         if isinstance( value, PObject ):
             super().__init__( value, *args, **kwargs )
         else:
-            if str == type( value ):
-                value, unit = SI.Prefix.fromString( value )
-            elif len( args ) > 0:
-                unit = args[0]
-                args = args[1:]
-            else:
-                unit = "A"
+            value, unit, args = _valueUnitArgs( value, args, "A" )
             super().__init__( value, unit, *args, **kwargs )
         if self.unit != "A":
             raise ValueError( "Current can only be initialized with a "
@@ -235,6 +245,8 @@ class Resistor( EEObject ):
     series by default.
     """
 
+    __slots__ = ()
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor.
@@ -245,14 +257,8 @@ class Resistor( EEObject ):
                       digits=<digits> (default: 3),
                       strictAscii=<bool> (default: False)
         """
-        try:
-            _ = kwargs["digits"]
-        except KeyError:
-            kwargs["digits"] = 3
-        try:
-            series = kwargs["series"]
-        except KeyError:
-            series = None
+        kwargs.setdefault( "digits", 3 )
+        series = kwargs.get( "series" )
 
         if isinstance( value, PObject ):
             if isinstance( value, EEObject ):
@@ -266,13 +272,7 @@ class Resistor( EEObject ):
         else:
             if series is None:
                 kwargs["series"] = "E12"
-            if str == type( value ):
-                value, unit = SI.Prefix.fromString( value )
-            elif len( args ) > 0:
-                unit = args[0]
-                args = args[1:]
-            elif 0 == len( args ):
-                unit = "Ω"
+            value, unit, args = _valueUnitArgs( value, args, "Ω" )
             super().__init__( value, unit, *args, **kwargs )
         if self.unit != "Ω":
             raise ValueError( "Unit for Resistor must be Ohm" )
@@ -285,6 +285,8 @@ class Capacitor( EEObject ):
     series.  @see also the companion class Crange.
     """
 
+    __slots__ = ()
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor.
@@ -295,14 +297,8 @@ class Capacitor( EEObject ):
                     digits=<digits> (default: 3),
                     strictAscii=<bool> (default: False)
         """
-        try:
-            _ = kwargs["digits"]
-        except KeyError:
-            kwargs["digits"] = 3
-        try:
-            series = kwargs["series"]
-        except KeyError:
-            series = None
+        kwargs.setdefault( "digits", 3 )
+        series = kwargs.get( "series" )
 
         if isinstance( value, PObject ):
             if isinstance( value, EEObject ):
@@ -316,13 +312,7 @@ class Capacitor( EEObject ):
         else:
             if series is None:
                 kwargs["series"] = "E6"
-            if str == type( value ):
-                value, unit = SI.Prefix.fromString( value )
-            elif len( args ) > 0:
-                unit = args[0]
-                args = args[1:]
-            elif 0 == len( args ):
-                unit = "F"
+            value, unit, args = _valueUnitArgs( value, args, "F" )
             super().__init__( value, unit, *args, **kwargs )
         if self.unit != "F":
             raise ValueError( "Unit for Capacitor must be Farad" )
@@ -338,6 +328,8 @@ class Inductor( EEObject ):
     particular series, use a PObject with unit "H".
     """
 
+    __slots__ = ()
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor.
@@ -348,21 +340,12 @@ class Inductor( EEObject ):
                       digits=<digits> (default: 3),
                       strictAscii=<bool> (default: False)
         """
-        try:
-            _ = kwargs["series"]
-        except KeyError:
-            kwargs["series"] = None
+        kwargs.setdefault( "series", None )
 
         if isinstance( value, PObject ):
             super().__init__( value, *args, **kwargs )
         else:
-            if str == type( value ):
-                value, unit = SI.Prefix.fromString( value )
-            elif len( args ) > 0:
-                unit = args[0]
-                args = args[1:]
-            elif 0 == len( args ):
-                unit = "H"
+            value, unit, args = _valueUnitArgs( value, args, "H" )
             super().__init__( value, unit, *args, **kwargs )
         if self.unit != "H":
             raise ValueError( "Unit for Inductor must be Henry" )
@@ -32,6 +32,9 @@
 #                   |                |
 
 import math
+import bisect
+
+__all__ = ['ESeries']
 
 
 class ESeries():
@@ -48,59 +51,60 @@ class ESeries():
     All methods require the name of the series as an argument, which can be one
     of "E3", "E6", "E12", "E24", "E48", "E96", "E192", 3, 6, 12, 24, 48, 96, or
     192.  It always defaults to "E12."  Alternatively, a custom series can be
-    supplied as the series argument, which then needs to be a list with
-    consecutive values spanning one decade starting with 1.0 and ending with a
-    value < 10.0.
+    supplied as the series argument, which then needs to be a list (or tuple)
+    with consecutive values spanning one decade starting with 1.0 and ending
+    with a value < 10.0.
 
     Since this class contains only static methods it does not need to be
     instantiated.
     """
 
     # Private class constants:
-    __eList = []
-    __eList.append( [1.0, 2.2, 4.7] )
-    __eList.append( [1.0, 1.5, 2.2, 3.3, 4.7, 6.8] )
-    __eList.append( [1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8,
-                     8.2] )
-    __eList.append( [1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
-                     3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2,
-                     9.1] )
-    __eList.append( [1.00, 1.05, 1.10, 1.15, 1.21, 1.27, 1.33, 1.40, 1.47, 1.54,
-                     1.62, 1.69, 1.78, 1.87, 1.96, 2.05, 2.15, 2.26, 2.37, 2.49,
-                     2.61, 2.74, 2.87, 3.01, 3.16, 3.32, 3.48, 3.65, 3.83, 4.02,
-                     4.22, 4.42, 4.64, 4.87, 5.11, 5.36, 5.62, 5.90, 6.19, 6.49,
-                     6.81, 7.15, 7.50, 7.87, 8.25, 8.66, 9.09, 9.53] )
-    __eList.append( [1.00, 1.02, 1.05, 1.07, 1.10, 1.13, 1.15, 1.18, 1.21, 1.24,
-                     1.27, 1.30, 1.33, 1.37, 1.40, 1.43, 1.47, 1.50, 1.54, 1.58,
-                     1.62, 1.65, 1.69, 1.74, 1.78, 1.82, 1.87, 1.91, 1.96, 2.00,
-                     2.05, 2.10, 2.15, 2.21, 2.26, 2.32, 2.37, 2.43, 2.49, 2.55,
-                     2.61, 2.67, 2.74, 2.80, 2.87, 2.94, 3.01, 3.09, 3.16, 3.24,
-                     3.32, 3.40, 3.48, 3.57, 3.65, 3.74, 3.83, 3.92, 4.02, 4.12,
-                     4.22, 4.32, 4.42, 4.53, 4.64, 4.75, 4.87, 4.99, 5.11, 5.23,
-                     5.36, 5.49, 5.62, 5.76, 5.90, 6.04, 6.19, 6.34, 6.49, 6.65,
-                     6.81, 6.98, 7.15, 7.32, 7.50, 7.68, 7.87, 8.06, 8.25, 8.45,
-                     8.66, 8.87, 9.09, 9.31, 9.53, 9.76] )
-    __eList.append( [1.00, 1.01, 1.02, 1.04, 1.05, 1.06, 1.07, 1.09, 1.10, 1.11,
-                     1.13, 1.14, 1.15, 1.17, 1.18, 1.20, 1.21, 1.23, 1.24, 1.26,
-                     1.27, 1.29, 1.30, 1.32, 1.33, 1.35, 1.37, 1.38, 1.40, 1.42,
-                     1.43, 1.45, 1.47, 1.49, 1.50, 1.52, 1.54, 1.56, 1.58, 1.60,
-                     1.62, 1.64, 1.65, 1.67, 1.69, 1.72, 1.74, 1.76, 1.78, 1.80,
-                     1.82, 1.84, 1.87, 1.89, 1.91, 1.93, 1.96, 1.98, 2.00, 2.03,
-                     2.05, 2.08, 2.10, 2.13, 2.15, 2.18, 2.21, 2.23, 2.26, 2.29,
-                     2.32, 2.34, 2.37, 2.40, 2.43, 2.46, 2.49, 2.52, 2.55, 2.58,
-                     2.61, 2.64, 2.67, 2.71, 2.74, 2.77, 2.80, 2.84, 2.87, 2.91,
-                     2.94, 2.98, 3.01, 3.05, 3.09, 3.12, 3.16, 3.20, 3.24, 3.28,
-                     3.32, 3.36, 3.40, 3.44, 3.48, 3.52, 3.57, 3.61, 3.65, 3.70,
-                     3.74, 3.79, 3.83, 3.88, 3.92, 3.97, 4.02, 4.07, 4.12, 4.17,
-                     4.22, 4.27, 4.32, 4.37, 4.42, 4.48, 4.53, 4.59, 4.64, 4.70,
-                     4.75, 4.81, 4.87, 4.93, 4.99, 5.05, 5.11, 5.17, 5.23, 5.30,
-                     5.36, 5.42, 5.49, 5.56, 5.62, 5.69, 5.76, 5.83, 5.90, 5.97,
-                     6.04, 6.12, 6.19, 6.26, 6.34, 6.43, 6.49, 6.57, 6.65, 6.73,
-                     6.81, 6.90, 6.98, 7.06, 7.15, 7.23, 7.32, 7.41, 7.50, 7.59,
-                     7.68, 7.77, 7.87, 7.96, 8.06, 8.16, 8.25, 8.35, 8.45, 8.56,
-                     8.66, 8.76, 8.87, 8.98, 9.09, 9.20, 9.31, 9.42, 9.53, 9.65,
-                     9.76, 9.88] )
-    __tolerance = [0.5, 0.2, 0.1, 0.05, 0.02, 0.01, 0.005]
+    __eList = (
+        (1.0, 2.2, 4.7),
+        (1.0, 1.5, 2.2, 3.3, 4.7, 6.8),
+        (1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2),
+        (1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0, 3.3, 3.6,
+         3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1),
+        (1.00, 1.05, 1.10, 1.15, 1.21, 1.27, 1.33, 1.40, 1.47, 1.54, 1.62, 1.69,
+         1.78, 1.87, 1.96, 2.05, 2.15, 2.26, 2.37, 2.49, 2.61, 2.74, 2.87, 3.01,
+         3.16, 3.32, 3.48, 3.65, 3.83, 4.02, 4.22, 4.42, 4.64, 4.87, 5.11, 5.36,
+         5.62, 5.90, 6.19, 6.49, 6.81, 7.15, 7.50, 7.87, 8.25, 8.66, 9.09,
+         9.53),
+        (1.00, 1.02, 1.05, 1.07, 1.10, 1.13, 1.15, 1.18, 1.21, 1.24, 1.27, 1.30,
+         1.33, 1.37, 1.40, 1.43, 1.47, 1.50, 1.54, 1.58, 1.62, 1.65, 1.69, 1.74,
+         1.78, 1.82, 1.87, 1.91, 1.96, 2.00, 2.05, 2.10, 2.15, 2.21, 2.26, 2.32,
+         2.37, 2.43, 2.49, 2.55, 2.61, 2.67, 2.74, 2.80, 2.87, 2.94, 3.01, 3.09,
+         3.16, 3.24, 3.32, 3.40, 3.48, 3.57, 3.65, 3.74, 3.83, 3.92, 4.02, 4.12,
+         4.22, 4.32, 4.42, 4.53, 4.64, 4.75, 4.87, 4.99, 5.11, 5.23, 5.36, 5.49,
+         5.62, 5.76, 5.90, 6.04, 6.19, 6.34, 6.49, 6.65, 6.81, 6.98, 7.15, 7.32,
+         7.50, 7.68, 7.87, 8.06, 8.25, 8.45, 8.66, 8.87, 9.09, 9.31, 9.53,
+         9.76),
+        (1.00, 1.01, 1.02, 1.04, 1.05, 1.06, 1.07, 1.09, 1.10, 1.11, 1.13, 1.14,
+         1.15, 1.17, 1.18, 1.20, 1.21, 1.23, 1.24, 1.26, 1.27, 1.29, 1.30, 1.32,
+         1.33, 1.35, 1.37, 1.38, 1.40, 1.42, 1.43, 1.45, 1.47, 1.49, 1.50, 1.52,
+         1.54, 1.56, 1.58, 1.60, 1.62, 1.64, 1.65, 1.67, 1.69, 1.72, 1.74, 1.76,
+         1.78, 1.80, 1.82, 1.84, 1.87, 1.89, 1.91, 1.93, 1.96, 1.98, 2.00, 2.03,
+         2.05, 2.08, 2.10, 2.13, 2.15, 2.18, 2.21, 2.23, 2.26, 2.29, 2.32, 2.34,
+         2.37, 2.40, 2.43, 2.46, 2.49, 2.52, 2.55, 2.58, 2.61, 2.64, 2.67, 2.71,
+         2.74, 2.77, 2.80, 2.84, 2.87, 2.91, 2.94, 2.98, 3.01, 3.05, 3.09, 3.12,
+         3.16, 3.20, 3.24, 3.28, 3.32, 3.36, 3.40, 3.44, 3.48, 3.52, 3.57, 3.61,
+         3.65, 3.70, 3.74, 3.79, 3.83, 3.88, 3.92, 3.97, 4.02, 4.07, 4.12, 4.17,
+         4.22, 4.27, 4.32, 4.37, 4.42, 4.48, 4.53, 4.59, 4.64, 4.70, 4.75, 4.81,
+         4.87, 4.93, 4.99, 5.05, 5.11, 5.17, 5.23, 5.30, 5.36, 5.42, 5.49, 5.56,
+         5.62, 5.69, 5.76, 5.83, 5.90, 5.97, 6.04, 6.12, 6.19, 6.26, 6.34, 6.43,
+         6.49, 6.57, 6.65, 6.73, 6.81, 6.90, 6.98, 7.06, 7.15, 7.23, 7.32, 7.41,
+         7.50, 7.59, 7.68, 7.77, 7.87, 7.96, 8.06, 8.16, 8.25, 8.35, 8.45, 8.56,
+         8.66, 8.76, 8.87, 8.98, 9.09, 9.20, 9.31, 9.42, 9.53, 9.65, 9.76,
+         9.88),
+        )
+    __tolerance = (0.5, 0.2, 0.1, 0.05, 0.02, 0.01, 0.005)
+    # indices into __eList for all accepted series names - other spellings,
+    # such as "e12" or "12", are normalized to these
+    __seriesIndex = {"E3": 0, "E6": 1, "E12": 2, "E24": 3, "E48": 4, "E96": 5,
+                     "E192": 6, 3: 0, 6: 1, 12: 2, 24: 3, 48: 4, 96: 5, 192: 6}
+    # decade factors 10**-30 through 10**30 - enough for all SI prefixes
+    __decades = tuple( 10.0**k for k in range( -30, 31 ) )
 
 
     @staticmethod
@@ -111,34 +115,66 @@ class ESeries():
         @return index into __eList for that series
         """
         try:
-            if int == type( series ):
-                index = series
-            else:
-                index = int( series )
-            index = round( math.log( index / 3 ) / math.log( 2 ) )
-        except ValueError:
-            series = series.upper()
-            if "E3" == series:
-                index = 0
-            elif "E6" == series:
-                index = 1
-            elif "E12" == series:
-                index = 2
-            elif "E24" == series:
-                index = 3
-            elif "E48" == series:
-                index = 4
-            elif "E96" == series:
-                index = 5
-            elif "E192" == series:
-                index = 6
-            else:
-                index = -1
-
-        if index < 0 or index > 6:
-            raise ValueError( "wrong series name entered: "
-                              "{0}".format( series ) )
-        return index
+            return ESeries.__seriesIndex[series]
+        except KeyError:
+            pass
+        # only strings can still be converted to valid names - like "e12" or
+        # "12"
+        if isinstance( series, str ):
+            name = series.upper()
+            if name.isdigit():
+                name = int( name )
+            try:
+                return ESeries.__seriesIndex[name]
+            except KeyError:
+                pass
+        raise ValueError( "wrong series name entered: "
+                          "{0}".format( series ) )
+
+
+    @staticmethod
+    def __decadeFactor( exponent ):
+        """!
+        @brief Return the factor 10**exponent for a decade from a table.
+        @param exponent integer exponent of the decade
+        @return 10**exponent as float
+        """
+        if -30 <= exponent <= 30:
+            return ESeries.__decades[exponent + 30]
+        return 10.0**exponent
+
+
+    @staticmethod
+    def __closest( value, elist ):
+        """!
+        @brief Return the closest value in a decade list to the given value.
+        @param value value to approximate
+        @param elist list with values of one decade of a series
+        @return float with closest value in series to given value
+        """
+        factor = ESeries.__decadeFactor( math.floor( math.log10( value ) ) )
+
+        # the closest value is either the one just below or just above value,
+        # both of which may be in an adjacent decade
+        index = bisect.bisect_left( elist, value / factor )
+        if index < len( elist ) and elist[index] * factor == value:
+            # value is already in the series - return the series value
+            # itself, which is a float even if value was an int
+            return elist[index] * factor
+        if 0 == index:
+            lower = elist[-1] * (factor / 10)
+            upper = elist[0] * factor
+            if abs( value - lower ) < abs( value - upper ):
+                return lower
+            return upper
+        lower = elist[index-1] * factor
+        if len( elist ) == index:
+            upper = elist[0] * (factor * 10)
+        else:
+            upper = elist[index] * factor
+        if abs( value - upper ) < abs( value - lower ):
+            return upper
+        return lower
 
 
     @staticmethod
@@ -148,10 +184,24 @@ class ESeries():
         @param series valstr or integer representing the series or custom list
         @return list with values of one decade for that series
         """
+        elist = ESeries.__list( series )
+        if isinstance( elist, tuple ):
+            # do not hand out the (immutable) built-in series
+            return list( elist )
+        return elist
+
+
+    @staticmethod
+    def __list( series ):
+        """!
+        @brief Return the values of one decade of a series without copying.
+        @param series valstr or integer representing the series or custom list
+        @return list or tuple with values of one decade for that series
+        """
         if series is None:
             raise ValueError( "No E-Series specified - "
                               "cannot compute list" )
-        if list == type( series ):
+        if isinstance( series, (list, tuple) ):
             if series[0] != 1.0 or series[-1] >= 10.0:
                 raise ValueError( "Custom series must span exactly one decade" )
             return series
@@ -170,7 +220,7 @@ class ESeries():
             raise ValueError( "No E-Series specified - "
                               "cannot compute len" )
 
-        if list == type( series ):
+        if isinstance( series, (list, tuple) ):
             return len( series )
 
         return len( ESeries.__eList[ESeries.__getIndex( series )] )
@@ -203,7 +253,7 @@ class ESeries():
             raise ValueError( "No E-Series specified - "
                               "cannot compute tolerance" )
 
-        if list == type( series ):
+        if isinstance( series, (list, tuple) ):
             sum = 0.
             for i in range( len( series ) - 1 ):
                 sum += (series[i+1] - series[i]) / (series[i+1] + series[i])
@@ -223,30 +273,27 @@ class ESeries():
         if series is None:
             return value
             
-        elist = ESeries.list( series )
-        factor = 10**math.floor( math.log10( value ) )
-
-        error = math.inf
-        index = 0
-        for i,val in enumerate( elist ):
-            newError = abs( value - val * factor )
-            if newError < error:
-                error = newError
-                index = i
-
-        # handle boundary cases
-        if 0 == index:
-            newError = abs( value - elist[-1] * factor / 10 )
-            if newError < error:
-                index = len( elist ) - 1
-                factor /= 10
-        elif len( elist ) - 1 == index:
-            newError = abs( value - elist[0] * factor * 10 )
-            if newError < error:
-                index = 0
-                factor *= 10
+        return ESeries.__closest( value, ESeries.__list( series ) )
 
-        return elist[index] * factor
+
+    @staticmethod
+    def closestList( values, series="E12" ):
+        """!
+        @brief Return a list with the closest values in a given series to all
+        given values.
+
+        This is faster than calling closest() for each value as the series is
+        only looked up once.
+        @param values iterable with values to approximate
+        @param series name of series (defaults to "E12")
+        @return list of floats with closest values in series to given values
+        """
+        if series is None:
+            return list( values )
+
+        elist = ESeries.__list( series )
+        closest = ESeries.__closest
+        return [closest( value, elist ) for value in values]
 
 
     @staticmethod
@@ -260,16 +307,21 @@ class ESeries():
         if series is None:
             raise ValueError( "No E-Series specified - cannot compute next" )
 
-        elist = ESeries.list( series )
-        factor = 10**math.floor( math.log10( value ) )
+        elist = ESeries.__list( series )
+        factor = ESeries.__decadeFactor( math.floor( math.log10( value ) ) )
 
-        for index,val in enumerate( elist ):
-            if val * factor > value: break
+        # find the first value in the decade that is greater than value - the
+        # binary search works on value / factor, which may round differently
+        # than val * factor, so the position is corrected where necessary
+        index = bisect.bisect_right( elist, value / factor )
+        while index > 0 and elist[index-1] * factor > value:
+            index -= 1
+        while index < len( elist ) and elist[index] * factor <= value:
+            index += 1
 
         # handle boundary case
-        if index >= (len( elist ) - 1) and val * factor <= value:
-            index = 0
-            factor *= 10
+        if len( elist ) == index:
+            return elist[0] * (factor * 10)
 
         return elist[index] * factor
 
@@ -286,20 +338,24 @@ class ESeries():
             raise ValueError( "No E-Series specified - "
                               "cannot compute previous" )
 
-        elist = ESeries.list( series )
-        factor = 10**math.floor( math.log10( value ) )
+        elist = ESeries.__list( series )
+        factor = ESeries.__decadeFactor( math.floor( math.log10( value ) ) )
 
-        error = math.inf
-        for i,val in enumerate( elist[::-1] ):
-            if val * factor < value: break
-        index = len( elist ) - 1 - i
+        # find the number of values in the decade that are less than value -
+        # the binary search works on value / factor, which may round
+        # differently than val * factor, so the position is corrected where
+        # necessary
+        index = bisect.bisect_left( elist, value / factor )
+        while index < len( elist ) and elist[index] * factor < value:
+            index += 1
+        while index > 0 and elist[index-1] * factor >= value:
+            index -= 1
 
         # handle boundary case
-        if index <= 0 and val * factor >= value:
-            index = len( elist ) - 1
-            factor /= 10
+        if 0 == index:
+            return elist[-1] * (factor / 10)
 
-        return elist[index] * factor
+        return elist[index-1] * factor
 
 
     @staticmethod
@@ -309,7 +365,9 @@ class ESeries():
 
         The returned list is not ordered by default but rather contains values
         increasingly further away from the starting value, always starting with
-        the lower value.  To get an ordered list, set sorted to True.
+        the lower value.  To get an ordered list, set sorted to True.  Each
+        series value is contained only once, even where the list crosses a
+        decade boundary.
         @param value central value for list
         @param series name of series (defaults to "E12")
         @param decades number of decades to return (can be < 1), defaults to 1
@@ -321,19 +379,46 @@ class ESeries():
             raise ValueError( "No E-Series specified - "
                               "cannot compute decade" )
 
+        elist = ESeries.__list( series )
+        last = len( elist ) - 1
+        # locate the next lower and the next higher value once and walk the
+        # list from there on, changing the decade where necessary
+        exponent = math.floor( math.log10( value ) )
+        factor = ESeries.__decadeFactor( exponent )
+        index = bisect.bisect_left( elist, value / factor )
+        while index <= last and elist[index] * factor < value:
+            index += 1
+        while index > 0 and elist[index-1] * factor >= value:
+            index -= 1
+
+        # the value itself is part of the list if it is in the series
         vlist = []
-        if value == ESeries.closest( value, series ):
+        if index <= last and elist[index] * factor == value:
             vlist.append( value )
 
-        steps = round( ESeries.len( series ) * decades )
-        lval = value
-        hval = value
+        lindex, lexponent, lfactor = index - 1, exponent, factor
+        index = bisect.bisect_right( elist, value / factor )
+        while index <= last and elist[index] * factor <= value:
+            index += 1
+        while index > 0 and elist[index-1] * factor > value:
+            index -= 1
+        hindex, hexponent, hfactor = index, exponent, factor
+
+        steps = round( (last + 1) * decades )
         while len( vlist ) < steps:
-            lval = ESeries.previous( lval, series )
-            vlist.append( lval )
+            if lindex < 0:
+                lindex = last
+                lexponent -= 1
+                lfactor = ESeries.__decadeFactor( lexponent )
+            vlist.append( elist[lindex] * lfactor )
+            lindex -= 1
             if len( vlist ) == steps: break
-            hval = ESeries.next( hval, series )
-            vlist.append( hval )
+            if hindex > last:
+                hindex = 0
+                hexponent += 1
+                hfactor = ESeries.__decadeFactor( hexponent )
+            vlist.append( elist[hindex] * hfactor )
+            hindex += 1
 
         if sorted: vlist.sort( reverse=reverse )
 
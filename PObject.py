@@ -72,11 +72,15 @@
 #                   |                |
 
 import math
+import cmath
 import copy
-import scipy
+import array
 
 from PObjects import SI
 
+__all__ = ['sqrt', 'PObject', 'Energy', 'Temperature', 'Time', 'Mass',
+           'Length', 'Frequency', 'ImperialLengthMisfits']
+
 
 def sqrt( value ):
     """!
@@ -95,6 +99,10 @@ def sqrt( value ):
     @param value radicant
     @return square root of radicant
     """
+    if isinstance( value, (int, float) ):
+        if value >= 0:
+            return math.sqrt( value )
+        return cmath.sqrt( value )
     return value**0.5
 
 
@@ -226,6 +234,9 @@ class PObject():
     which is always a floating point number.  Also, calculating inherent
     uncertainties internally is beyond the scope of this class.
     """
+
+    __slots__ = ("__value", "__unit", "__args", "__kwargs", "__digits",
+                 "__precision", "__strictAscii", "__isUnitless")
         
     @staticmethod
     def valueList( polist ):
@@ -243,11 +254,16 @@ class PObject():
         @param polist list with PObject-derived objects
         @return list with only values of all objects
         """
-        try:
-            return [item if item == 0 else item.value for item in polist]
-        except AttributeError as e:
-            raise ValueError( "elements in list need to be PObjects or 0" ) \
-                from e
+        values = []
+        for i, item in enumerate( polist ):
+            if isinstance( item, PObject ):
+                values.append( item.value )
+            elif item == 0:
+                values.append( item )
+            else:
+                raise ValueError( "elements in list need to be PObjects or 0 "
+                                  "- element {0} is {1}".format( i, item ) )
+        return values
 
 
     @staticmethod
@@ -266,11 +282,32 @@ class PObject():
         @param polist list with PObject-derived objects
         @return list with values of all objects converted to floats
         """
-        try:
-            return [0. if item == 0 else float( item.value ) for item in polist]
-        except AttributeError as e:
-            raise ValueError( "elements in list need to be PObjects or 0" ) \
-                from e
+        values = []
+        for i, item in enumerate( polist ):
+            if isinstance( item, PObject ):
+                value = item.value
+                values.append( 0. if value == 0 else float( value ) )
+            elif item == 0:
+                values.append( 0. )
+            else:
+                raise ValueError( "elements in list need to be PObjects or 0 "
+                                  "- element {0} is {1}".format( i, item ) )
+        return values
+
+
+    @staticmethod
+    def floatArray( polist ):
+        """!
+        @brief Convert a list with PObjects into an array of doubles with the
+               values in base SI units only - the unit is not returned.
+
+        Same as floatList, but the values are stored in one contiguous buffer
+        of C doubles, which can be handed to C libraries (e.g. via ctypes) or
+        to numpy.frombuffer() without another conversion.
+        @param polist list with PObject-derived objects
+        @return array.array of type "d" with values of all objects
+        """
+        return array.array( "d", PObject.floatList( polist ) )
 
 
     @staticmethod
@@ -290,44 +327,45 @@ class PObject():
         @param polist list with PObject-derived objects
         @return tuple with list of float values and unit for all of them
         """
-        minobj = min( polist )
-        if minobj == 0:
-            if  max( polist ) == 0:
-                return ([0] * len( polist ), "")
-
-        maxobj = minobj
-
+        # find the nonzero elements with the smallest and largest magnitude
+        # in one pass, checking the elements on the way
+        unit = None
+        minValue = maxValue = None
         for element in polist:
-            if element != 0:
-                if not isinstance( element, PObject ):
-                    raise ValueError( "elements in list need to be PObjects" )
-                if element.unit != minobj.unit:
-                    raise ValueError( "all elements in list must have same "
-                                      "unit" )
-            element = abs( element )
-            if element < minobj:
-                minobj = element
-            elif element > maxobj:
-                maxobj = element
-
-        _, maxunit = SI.Prefix.standardizeTuple( (maxobj.value, maxobj.unit) )
-        if minobj != 0:
-            _, minunit = SI.Prefix.standardizeTuple( (minobj.value,
-                                                      minobj.unit) )
-
-            if minunit != maxunit:
-                # convert all elements to base unit
-                return (PObject.floatList( polist ), minobj.unit)
+            if not isinstance( element, PObject ):
+                if element == 0: continue
+                raise ValueError( "elements in list need to be PObjects" )
+            value = abs( element.value )
+            if 0 == value: continue
+            if unit is None:
+                unit = element.unit
+            elif element.unit != unit:
+                raise ValueError( "all elements in list must have same "
+                                  "unit" )
+            if minValue is None or value < minValue:
+                minValue = value
+            if maxValue is None or value > maxValue:
+                maxValue = value
+
+        if unit is None:
+            # only zeros
+            return ([0] * len( polist ), "")
+
+        _, maxunit = SI.Prefix.standardizeTuple( (maxValue, unit) )
+        _, minunit = SI.Prefix.standardizeTuple( (minValue, unit) )
+        if minunit != maxunit:
+            # convert all elements to base unit
+            return (PObject.floatList( polist ), unit)
 
         vallist = []
         for obj in polist:
-            if obj != 0:
-                val, unit = SI.Prefix.standardizeTuple( (obj.value, obj.unit) )
+            if isinstance( obj, PObject ) and obj.value != 0:
+                val, _ = SI.Prefix.standardizeTuple( (obj.value, obj.unit) )
             else:
                 val = 0
             vallist.append( val )
 
-        return (vallist, unit)
+        return (vallist, maxunit)
 
 
     def __init__( self, value, *args, **kwargs ):
@@ -363,16 +401,15 @@ class PObject():
 
         if isinstance( value, str ):
             # called with value-and-unit string
-            vlist = value.split( " " )
-            if len( vlist ) <= 2:
+            if value.count( " " ) <= 1:
                 # only one unit item - may contain SI prefix and can
                 # be handled by SI.Prefix
                 (self.__value, unit) = SI.Prefix.fromString( value )
             else:
                 # more than one unit item needs to be handled natively
                 # and cannot contain any SI prefix
-                self.__value = float( vlist[0] )
-                unit = " ".join( vlist[1:] )
+                number, _, unit = value.partition( " " )
+                self.__value = float( number )
             self.__args = args
             self.__kwargs = kwargs
         elif isinstance( value, PObject ):
@@ -382,37 +419,27 @@ class PObject():
             unit = value.unit
             # args and kwargs are first also derived from it
             self.__args = value._args
-            self.__kwargs = value._kwargs
+            self.__kwargs = dict( value._kwargs )
             # but supplied arguments override
-            try:
-                self.__kwargs["digits"] = kwargs["digits"]
-            except KeyError:
-                pass
-            try:
-                self.__kwargs["strictAscii"] = kwargs["strictAscii"]
-            except KeyError:
-                pass
-            try:
-                self.__kwargs["precision"] = kwargs["precision"]
-            except KeyError:
-                pass
+            for key in ("digits", "strictAscii", "precision"):
+                if key in kwargs:
+                    self.__kwargs[key] = kwargs[key]
         elif isinstance( value, (int, float, complex) ):
             # called with numerical value only, requires unit in args tuple or
             # results in unitless PObject if nothing is given
             if len( args ) < 1:
                 self.__value = value
                 unit = ""
-            elif str == type( args[0] ):
-                if len( args[0].split( " " ) ) == 1:
+            elif isinstance( args[0], str ):
+                if -1 == args[0].find( " " ):
                     # unit is not composite string and can have prefix
-                    (self.__value, unit) = SI.Prefix.fromString( str( value )
-                                                                 + " "
-                                                                 + args[0] )
+                    (self.__value, unit) = SI.Prefix.normalizeTuple(
+                                                            (value, args[0]) )
                 else:
                     # unit is composite string and can not have prefixes
                     self.__value = value
                     unit = args[0]
-            elif SI.Unit == type( args[0] ):
+            elif isinstance( args[0], SI.Unit ):
                 # first argument is proper SI Unit
                 self.__value = value
                 unit = args[0]
@@ -431,30 +458,19 @@ class PObject():
                               "but must be string, number or PObject"
                               .format( type( value ) ) )
 
-        try:
-            self.__digits = self.__kwargs["digits"]
-        except KeyError:
-            self.__digits = 6
-            self.__kwargs["digits"] = self.digits
-        try:
-            self.__precision = self.__kwargs["precision"]
-        except KeyError:
-            self.__precision = 0
-            self.__kwargs["precision"] = self.precision
+        self.__digits = self.__kwargs.setdefault( "digits", 6 )
+        self.__precision = self.__kwargs.setdefault( "precision", 0 )
+        self.__strictAscii = self.__kwargs.setdefault( "strictAscii", False )
 
-        try:
-            self.__strictAscii = self.__kwargs["strictAscii"]
-        except KeyError:
-            self.__strictAscii = False
-            self.__kwargs["strictAscii"] = self.__strictAscii
-
-        if str == type( unit ):
-            self.__unit = SI.Unit( unit )
-        elif SI.Unit == type( unit ):
+        if isinstance( unit, str ):
+            self.__unit = SI.Unit.fromString( unit )
+        elif isinstance( unit, SI.Unit ):
             self.__unit = unit
         else:
             raise ValueError( "unit {0} must be string or SI.Unit object "
                               "but is {1}".format( unit, type( unit ) ) )
+        # units never change, so the operators can check a plain attribute
+        self.__isUnitless = self.__unit.isUnitless
 
         return
 
@@ -464,14 +480,13 @@ class PObject():
         @brief Return a pretty string representing the object.
         @return string containing string representation of value and unit
         """
-        if float == type( self.__value ) and \
-           1 == len( str( self.__unit ).split( " " )) and \
-           -1 == str( self.__unit ).find( "**" ):
-            return SI.Prefix.toString( (self.__value, str( self.__unit )),
+        unit = str( self.__unit )
+        if isinstance( self.__value, float ) and \
+           -1 == unit.find( " " ) and -1 == unit.find( "**" ):
+            return SI.Prefix.toString( (self.__value, unit),
                                        digits=self.__digits,
                                        strictAscii=self.__strictAscii )
-        fstring = "{{0:.{0}g}} {{1}}".format( self.__digits )
-        return fstring.format( self.__value, self.__unit )
+        return "{0:.{1}g} {2}".format( self.__value, self.__digits, unit )
 
 
     def __format__( self, formatSpec ):
@@ -484,13 +499,13 @@ class PObject():
         @param formatSpec Python format specifier
         @return string containing string representation of value and unit
         """
-        if float == type( self.__value ) and \
-                1 == len( str( self.__unit ).split( " " )) and \
-                -1 == str( self.__unit ).find( "**" ):
-            return SI.Prefix.toString( (self.__value, str( self.__unit )),
+        unit = str( self.__unit )
+        if isinstance( self.__value, float ) and \
+           -1 == unit.find( " " ) and -1 == unit.find( "**" ):
+            return SI.Prefix.toString( (self.__value, unit),
                                        formatSpec=formatSpec,
                                        strictAscii=self.__strictAscii )
-        return format( self.__value, formatSpec ) + " " + str( self.__unit )
+        return format( self.__value, formatSpec ) + " " + unit
 
 
     def __repr__( self ):
@@ -505,37 +520,84 @@ class PObject():
 
     def copy( self ):
         """!
-        @brief Make a (deep) copy of self.
+        @brief Make a copy of self.
 
         This is a Python idiosyncrasy - similar to the copy() method in dicts.
+        Value, unit, and positional arguments cannot change and are shared with
+        the copy; only the keyword arguments are copied.
         """
-        return copy.deepcopy( self )
+        obj = copy.copy( self )
+        obj.__kwargs = dict( self.__kwargs )
+        return obj
 
 
-    def __add__( self, other ):
+    def __like( self, value, kwargs ):
         """!
-        @brief Overload addition operator (self + other)
-        @param other other object to add to ourselves
-        @return Object of same class with result
+        @brief Create an object of the same class and unit as self with another
+        value.
+
+        Plain PObjects are filled in directly as their constructor would merely
+        store the arguments; derived classes may check or adjust the value
+        (EEObjects, for instance, confine it to their series) and are always
+        created via their constructor.
+        @param value numerical value of the new object
+        @param kwargs keyword arguments for the new object
+        @return new object
+        """
+        if PObject is not self.__class__ or \
+           not isinstance( value, (int, float, complex) ):
+            return self.__class__( value, self.__unit, *self.__args, **kwargs )
+        obj = PObject.__new__( PObject )
+        obj.__value = value
+        obj.__unit = self.__unit
+        obj.__isUnitless = self.__isUnitless
+        obj.__args = self.__args
+        obj.__kwargs = kwargs = dict( kwargs )
+        obj.__digits = kwargs.setdefault( "digits", 6 )
+        obj.__precision = kwargs.setdefault( "precision", 0 )
+        obj.__strictAscii = kwargs.setdefault( "strictAscii", False )
+        return obj
+
+
+    def __summand( self, other, subtract ):
+        """!
+        @brief Check that other can be added to or subtracted from self and
+        obtain its value and the keyword arguments for the result.
+        @param other other object to add or subtract
+        @param subtract True for subtraction, False for addition (only used
+                        for error messages)
+        @return tuple with value of other and kwargs for resulting object
         """
-        kwargs = self._kwargs
         if not isinstance( other, PObject ):
-            if other == 0 or self.isUnitless:
-                resval = self.__value + other
-            else:
-                raise ValueError( "can only add 0 to any PObject or any "
-                                  "number to a unitless PObject" )
-        elif other.unit != self.unit:
+            if other == 0 or self.__isUnitless:
+                return other, self.__kwargs
+            if subtract:
+                raise ValueError( "can only subtract 0 from any PObject or "
+                                  "any number from a unitless PObject" )
+            raise ValueError( "can only add 0 to any PObject or any "
+                              "number to a unitless PObject" )
+        if other.__unit != self.__unit:
+            if subtract:
+                raise ValueError( "only objects with identical units "
+                                  "can be subtracted from each other" )
             raise ValueError( "only objects with identical units "
                               "can be added to each other" )
-        else:
-            resval = self.__value + other.value
-            kwargs["digits"] = max( self.__digits, other.digits )
+        # do not change the digits of self
+        kwargs = dict( self.__kwargs,
+                       digits=max( self.__digits, other.__digits ) )
+        return other.__value, kwargs
+
 
-        if self.isUnitless:
-            return resval
-        return self.__class__( resval, self.__unit,
-                               *self.__args, **kwargs )
+    def __add__( self, other ):
+        """!
+        @brief Overload addition operator (self + other)
+        @param other other object to add to ourselves
+        @return Object of same class with result
+        """
+        value, kwargs = self.__summand( other, False )
+        if self.__isUnitless:
+            return self.__value + value
+        return self.__like( self.__value + value, kwargs )
 
 
     def __radd__( self, other ):
@@ -553,19 +615,9 @@ class PObject():
         @param other other object to add to ourselves
         @return self now containing result
         """
-        if not isinstance( other, PObject ):
-            if other == 0 or self.isUnitless:
-                self.__value += other
-            else:
-                raise ValueError( "can only add 0 to any PObject or any "
-                                  "number to a unitless PObject" )
-        elif other.unit != self.unit:
-            raise ValueError( "only objects with identical units "
-                              "can be added to each other" )
-        else:
-            self.__value += other.value
-
-        if self.isUnitless:
+        value, _ = self.__summand( other, False )
+        self.__value += value
+        if self.__isUnitless:
             return self.__value
         return self
 
@@ -576,24 +628,10 @@ class PObject():
         @param other other object to subtract from ourselves
         @return Object of same class with result
         """
-        kwargs = self.__kwargs
-        if not isinstance( other, PObject ):
-            if other == 0 or self.isUnitless:
-                resval = self.__value - other
-            else:
-                raise ValueError( "can only subtract 0 from any PObject "
-                                  "or any number from a unitless PObject" )
-        elif other.unit != self.unit:
-            raise ValueError( "only objects with identical units "
-                              "can be subtracted from each other" )
-        else:
-            resval = self.__value - other.value
-            kwargs["digits"] = max( self.__digits, other.digits )
-
-        if self.isUnitless:
-            return resval
-        return self.__class__( resval, self.__unit,
-                               *self.__args, **kwargs )
+        value, kwargs = self.__summand( other, True )
+        if self.__isUnitless:
+            return self.__value - value
+        return self.__like( self.__value - value, kwargs )
 
 
     def __rsub__( self, other ):
@@ -602,24 +640,10 @@ class PObject():
         @param other other object to subtract ourselves from
         @return Object of same class with result
         """
-        kwargs = self.__kwargs
-        if not isinstance( other, PObject ):
-            if other == 0 or self.isUnitless:
-                resval = other - self.__value
-            else:
-                raise ValueError( "can only subtract any PObject from 0 or "
-                                  "a unitless PObject from any number" )
-        elif other.unit != self.unit:
-            raise ValueError( "only objects with identical units "
-                              "can be subtracted from each other" )
-        else:
-            resval = other.value - self.__value
-            kwargs["digits"] = max( self.__digits, other.digits )
-
-        if self.isUnitless:
-            return resval
-        return self.__class__( resval, self.__unit,
-                               *self.__args, **kwargs )
+        value, kwargs = self.__summand( other, True )
+        if self.__isUnitless:
+            return value - self.__value
+        return self.__like( value - self.__value, kwargs )
 
 
     def __isub__( self, other ):
@@ -628,19 +652,9 @@ class PObject():
         @param other other object to subtract from ourselves
         @return self now containing result
         """
-        if not isinstance( other, PObject ):
-            if other == 0 or self.isUnitless:
-                self.__value -= other
-            else:
-                raise ValueError( "can only subtract 0 from any PObject or any "
-                                  "number from unitless PObject" )
-        elif other.unit != self.unit:
-            raise ValueError( "only objects with identical units "
-                              "can be subtracted from each other" )
-        else:
-            self.__value -= other.value
-
-        if self.isUnitless:
+        value, _ = self.__summand( other, True )
+        self.__value -= value
+        if self.__isUnitless:
             return self.__value
         return self
 
@@ -656,17 +670,17 @@ class PObject():
         @return Object of same class or PObject with result
         """
         if isinstance( other, PObject ):
-            kwargs = self.__kwargs
-            kwargs["digits"] = max( self.__digits, other.digits )
-            res = PObject( self.__value * other.value,
-                           self.__unit * other.unit,
+            # do not change the digits of self
+            kwargs = dict( self.__kwargs,
+                           digits=max( self.__digits, other.__digits ) )
+            res = PObject( self.__value * other.__value,
+                           self.__unit * other.__unit,
                            *self.__args, **kwargs )
         else:
-            res = self.__class__( self.__value * other, self.__unit,
-                                  *self.__args, **self.__kwargs )
+            res = self.__like( self.__value * other, self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
@@ -684,12 +698,12 @@ class PObject():
             self.__value *= other
             res = self
         else:
-            res = PObject( self.__value * other.value,
-                           self.__unit * other.unit,
+            res = PObject( self.__value * other.__value,
+                           self.__unit * other.__unit,
                            *self.__args, **self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
@@ -701,11 +715,10 @@ class PObject():
         """
         if isinstance( other, PObject ):
             raise ValueError( "We did not expect to get here" )
-        res = self.__class__( other * self.__value, self.__unit,
-                                *self.__args, **self.__kwargs )
+        res = self.__like( other * self.__value, self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
@@ -716,17 +729,17 @@ class PObject():
         @return Object of same class or PObject with result
         """
         if isinstance( other, PObject ):
-            kwargs = self.__kwargs
-            kwargs["digits"] = max( self.__digits, other.digits )
-            res = PObject( self.__value / other.value,
-                           self.__unit / other.unit,
+            # do not change the digits of self
+            kwargs = dict( self.__kwargs,
+                           digits=max( self.__digits, other.__digits ) )
+            res = PObject( self.__value / other.__value,
+                           self.__unit / other.__unit,
                            *self.__args, **kwargs )
         else:
-            res = self.__class__( self.__value / other, self.__unit,
-                                  *self.__args, **self.__kwargs )
+            res = self.__like( self.__value / other, self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
@@ -740,12 +753,12 @@ class PObject():
             self.__value /= other
             res = self
         else:
-            res = PObject( self.__value / other.value,
-                           self.__unit / other.unit,
+            res = PObject( self.__value / other.__value,
+                           self.__unit / other.__unit,
                            *self.__args, **self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
@@ -762,8 +775,8 @@ class PObject():
                        1 / self.__unit,
                        *self.__args, **self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
@@ -774,11 +787,11 @@ class PObject():
         @return always a PObject - not one of the derived objects
         """
         if other == 0:
-            return 1
+            return 1.0
 
         if isinstance( other, PObject ):
-            if other.isUnitless:
-                other = other.value
+            if other.__isUnitless:
+                other = other.__value
             else:
                 raise ValueError( "Cannot raise any object to the power "
                                   "of a PObject with non-blank unit" )
@@ -786,8 +799,8 @@ class PObject():
         res = PObject( self.__value**other, self.__unit**other,
                        *self.__args, **self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
@@ -796,11 +809,10 @@ class PObject():
         @brief Overload absolute value operator (abs( self ))
         @return Object of same class with result
         """
-        res = self.__class__( abs( self.__value ), self.__unit,
-                              *self.__args, **self.__kwargs )
+        res = self.__like( abs( self.__value ), self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
@@ -809,26 +821,35 @@ class PObject():
         @brief Overload negative sign operator (-self)
         @return Object of same class with result
         """
-        res = self.__class__( -self.__value, self.__unit,
-                              *self.__args, **self.__kwargs )
+        res = self.__like( -self.__value, self.__kwargs )
 
-        if res.isUnitless:
-            return res.value
+        if res.__isUnitless:
+            return res.__value
         return res
 
 
-    def __lt__( self, other ):
+    def __comparands( self, other ):
         """!
-        @brief Overload < operator (self < other)
+        @brief Obtain the values to compare in the ordering operators.
         @param other other object to compare ourselves to
+        @return tuple with our value and the value to compare it to
         """
         if not isinstance( other, PObject ):
-            if not (self.isUnitless or other == 0):
+            if not (self.__isUnitless or other == 0):
                 raise ValueError( "can only compare like objects" )
-            return self.__value < other
-        if self.unit != other.unit:
+            return self.__value, other
+        if self.__unit != other.__unit:
             raise ValueError( "can only compare objects with like units" )
-        return self.__value < other.value
+        return self.__value, other.__value
+
+
+    def __lt__( self, other ):
+        """!
+        @brief Overload < operator (self < other)
+        @param other other object to compare ourselves to
+        """
+        value, otherValue = self.__comparands( other )
+        return value < otherValue
 
 
     def __le__( self, other ):
@@ -837,13 +858,8 @@ class PObject():
         @param other other object to compare ourselves to
         @return boolean value as result
         """
-        if not isinstance( other, PObject ):
-            if not (self.isUnitless or other == 0):
-                raise ValueError( "can only compare like objects" )
-            return self.__value <= other
-        if self.unit != other.unit:
-            raise ValueError( "can only compare objects with like units" )
-        return self.__value <= other.value
+        value, otherValue = self.__comparands( other )
+        return value <= otherValue
 
 
     def __gt__( self, other ):
@@ -852,13 +868,8 @@ class PObject():
         @param other other object to compare ourselves to
         @return boolean value as result
         """
-        if not isinstance( other, PObject ):
-            if not (self.isUnitless or other == 0):
-                raise ValueError( "can only compare like objects" )
-            return self.__value > other
-        if self.unit != other.unit:
-            raise ValueError( "can only compare objects with like units" )
-        return self.__value > other.value
+        value, otherValue = self.__comparands( other )
+        return value > otherValue
 
 
     def __ge__( self, other ):
@@ -867,13 +878,8 @@ class PObject():
         @param other other object to compare ourselves to
         @return boolean value as result
         """
-        if not isinstance( other, PObject ):
-            if not (self.isUnitless or other == 0):
-                raise ValueError( "can only compare like objects" )
-            return self.__value >= other
-        if self.unit != other.unit:
-            raise ValueError( "can only compare objects with like units" )
-        return self.__value >= other.value
+        value, otherValue = self.__comparands( other )
+        return value >= otherValue
 
 
     def __eq__( self, other ):
@@ -883,10 +889,10 @@ class PObject():
         @return boolean value as result
         """
         if not isinstance( other, PObject ):
-            if not (self.isUnitless or other == 0):
+            if not (self.__isUnitless or other == 0):
                 return False
             return self.__value == other
-        return self.__value == other.value and self.__unit == other.unit
+        return self.__value == other.__value and self.__unit == other.__unit
 
 
     def __ne__( self, other ):
@@ -896,10 +902,10 @@ class PObject():
         @return boolean value as result
         """
         if not isinstance( other, PObject ):
-            if not (self.isUnitless or other == 0):
+            if not (self.__isUnitless or other == 0):
                 return True
             return self.value != other
-        return self.__value != other.value or self.__unit != other.unit
+        return self.__value != other.__value or self.__unit != other.__unit
 
 
     def __bool__( self ):
@@ -947,7 +953,7 @@ class PObject():
         """!
         @brief Test whether object is unitless.
         """
-        return self.__unit.isUnitless
+        return self.__isUnitless
 
 
     @property
@@ -1011,13 +1017,18 @@ class Energy( PObject ):
     in the (mksA) SI system, i.e. in this case a PObject with "J" as unit.
     """
 
+    __slots__ = ("__printUnit",)
+
 
     # Avoid circular dependencies - define physical constants here so as not to
-    # include Const
-    __e_0 = scipy.constants.physical_constants['elementary charge'][0]
+    # include Const (the elementary charge in C is exact by definition of the SI)
+    __e_0 = 1.602176634e-19
     __calConv = 4.1858
     __ergConv = 1.0e-07
 
+    # factors to convert the supported energy units to J
+    __toJoule = {"J": 1.0, "eV": __e_0, "cal": __calConv, "erg": __ergConv}
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor - use as
@@ -1069,21 +1080,15 @@ class Energy( PObject ):
             raise ValueError( "Energy: initialized without required unit" )
 
         # convert to J as needed
-        if "eV" == unit:
-            value *= Energy.__e_0
-        elif "cal" == unit:
-            value *= Energy.__calConv
-        elif "erg" == unit:
-            value *= Energy.__ergConv
-        elif "J" != unit:
+        unit = str( unit )
+        factor = Energy.__toJoule.get( unit )
+        if factor is None:
             raise ValueError( "Wrong energy unit specified: " + unit )
+        value *= factor
 
         super().__init__( value, "J", *args, **kwargs )
 
-        try:
-            self.__printUnit = self._kwargs["printUnit"]
-        except KeyError:
-            self.__printUnit = "J"
+        self.__printUnit = self._kwargs.get( "printUnit", "J" )
 
         return
 
@@ -1093,19 +1098,12 @@ class Energy( PObject ):
         @brief Return a pretty string representing the object.
         @return string containing string representation of value and unit
         """
-        if "eV" == self.__printUnit:
-            return SI.Prefix.toString( (self.value / Energy.__e_0, "eV"),
-                                       self.digits,
-                                       strictAscii=self._strictAscii  )
-        if "cal" == self.__printUnit:
-            return SI.Prefix.toString( (self.value / Energy.__calConv, "cal"), 
-                                       self.digits,
-                                       strictAscii=self._strictAscii  )
-        if "erg" == self.__printUnit:
-            return SI.Prefix.toString( (self.value * 1.e+07, "erg"), 
-                                       self.digits,
-                                       strictAscii=self._strictAscii  )
-        return super().__str__()
+        factor = Energy.__toJoule.get( self.__printUnit )
+        if factor is None or "J" == self.__printUnit:
+            return super().__str__()
+        return SI.Prefix.toString( (self.value / factor, self.__printUnit),
+                                   self.digits,
+                                   strictAscii=self._strictAscii  )
 
 
     @property
@@ -1129,7 +1127,7 @@ class Energy( PObject ):
         which this object is printed.  Internally it is always strictly stored
         mksA SI units.
         """
-        if not unit in ("J", "eV", "cal", "erg"):
+        if not unit in Energy.__toJoule:
             raise ValueError( "Wrong Energy unit specified: " + unit )
         self.__printUnit = unit
         self._kwargs["printUnit"] = self.__printUnit
@@ -1158,12 +1156,25 @@ class Temperature( PObject ):
     unit the Temperature object was initialized with (or instructed to print).
     """
 
+    __slots__ = ("__printUnit",)
+
     __absZeroC = -273.15 # absolute zero in ºC
     __freezingF = 32     # temperature of freezing water in ºF
     __boilingF = 212     # temperature of boiling water in ºF
 
     __convFactor = (__boilingF - __freezingF) / 100.
 
+    # (offset, factor, absolute zero) of the supported temperature units such
+    # that T in K = (T in unit - offset) / factor - absolute zero
+    __toKelvin = {"K": (0, 1, 0),
+                  "ºC": (0, 1, __absZeroC),
+                  "ºF": (__freezingF, __convFactor, __absZeroC)}
+
+    # print units accepted by the printUnit setter and their normalized names
+    __printUnits = {"K": "K",
+                    "ºC": "ºC", "deg C": "ºC",
+                    "ºF": "ºF", "deg F": "ºF"}
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor - use as
@@ -1223,30 +1234,23 @@ class Temperature( PObject ):
 
 
         # convert to Kelvin
-        if "ºC" == unit:
-            value -= Temperature.__absZeroC
-        elif "ºF" == unit:
-            value = (value - Temperature.__freezingF) / \
-                    Temperature.__convFactor  -  Temperature.__absZeroC
-        elif "K" != unit:
+        try:
+            offset, factor, absZero = Temperature.__toKelvin[unit]
+        except KeyError:
             raise ValueError( "Temperature: Wrong temperature unit "
-                              "specified: " + unit )
+                              "specified: " + unit ) from None
+        value = (value - offset) / factor - absZero
 
         if value < 0:
             raise ValueError( "Temperature cannot go below absolute zero" )
 
-        try:
-            if kwargs["printUnit"].startswith( "deg" ):
-                kwargs["printUnit"] = kwargs["printUnit"].replace( "deg ", "º" )
-        except KeyError:
-            pass
+        printUnit = kwargs.get( "printUnit" )
+        if printUnit is not None and printUnit.startswith( "deg" ):
+            kwargs["printUnit"] = printUnit.replace( "deg ", "º" )
 
         super().__init__( value, "K", *args, **kwargs )
 
-        try:
-            self.__printUnit = self._kwargs["printUnit"]
-        except KeyError:
-            self.__printUnit = "K"
+        self.__printUnit = self._kwargs.get( "printUnit", "K" )
 
         return
 
@@ -1257,21 +1261,18 @@ class Temperature( PObject ):
         """
         if "K" == self.__printUnit:
             return super().__str__()
-        if "ºC" == self.__printUnit:
-            value = self.value + Temperature.__absZeroC
-        elif "ºF" == self.__printUnit:
-            value = (self.value + Temperature.__absZeroC) * \
-                    Temperature.__convFactor + Temperature.__freezingF
-        else:
-            raise ValueError( "Internal Temperature error" )
+        try:
+            offset, factor, absZero = Temperature.__toKelvin[self.__printUnit]
+        except KeyError:
+            raise ValueError( "Internal Temperature error" ) from None
+        value = (self.value + absZero) * factor + offset
 
         if self._strictAscii:
             unit = self.__printUnit.replace( "º", "deg " )
         else:
             unit = self.__printUnit
 
-        fstring = "{{0:.{0}f}} {{1}}".format( self.digits )
-        return fstring.format( value, unit )
+        return "{0:.{1}f} {2}".format( value, self.digits, unit )
 
 
     @property
@@ -1295,14 +1296,10 @@ class Temperature( PObject ):
         which this object is printed.  Internally it is always strictly stored
         mksA SI units.
         """
-        if "K" == unit:
-            self.__printUnit = unit
-        elif unit in ("ºC", "deg C"):
-            self.__printUnit = "ºC"
-        elif unit in ("ºF", "deg F"):
-            self.__printUnit = "ºF"
-        else:
+        printUnit = Temperature.__printUnits.get( unit )
+        if printUnit is None:
             raise ValueError( "Wrong Temperature unit specified: " + unit )
+        self.__printUnit = printUnit
         self._kwargs["printUnit"] = self.__printUnit
         return
 
@@ -1316,6 +1313,19 @@ class Time( PObject ):
     seconds only.
     """
 
+    __slots__ = ()
+
+    __minute = 60
+    __hour = 3600
+    __day = 86400
+    __year = 31556952   # mean Gregorian year
+
+    # factors to convert the supported time units to s
+    __toSeconds = {"min": __minute, "minutes": __minute,
+                   "h": __hour, "hours": __hour,
+                   "d": __day, "days": __day,
+                   "y": __year, "years": __year}
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor - use as
@@ -1352,17 +1362,9 @@ class Time( PObject ):
                 value, unit = SI.Prefix.fromString( value )
             elif len( args ) > 0:
                 unit = str( args[0] )
-                if unit in ("min", "minutes"):
-                    value *= 60
-                    unit = "s"
-                elif unit in ("h", "hours"):
-                    value *= 3600
-                    unit = "s"
-                elif unit in ("d", "days"):
-                    value *= 86400
-                    unit = "s"
-                elif unit in ("y", "years"):
-                    value *= 31556952
+                factor = Time.__toSeconds.get( unit )
+                if factor is not None:
+                    value *= factor
                     unit = "s"
                 elif not unit.endswith( "s" ):
                     raise ValueError( "Time: initialized with wrong unit: {0}"
@@ -1382,13 +1384,14 @@ class Time( PObject ):
         @brief Return a pretty string representing the object.
         @return string containing string representation of value and unit
         """
-        years = int( self.value // 31556952 )
-        days = int( (self.value - years * 31556952) // 86400 )
-        hours = int( (self.value - years * 31556952 - days * 86400) // 3600 )
-        minutes = int( (self.value - years * 31556952 - days * 86400
-                        - hours * 3600) // 60 )
-        seconds = self.value - years * 31556952 - days * 86400 - hours * 3600 \
-                  - minutes * 60
+        years, seconds = divmod( self.value, Time.__year )
+        days, seconds = divmod( seconds, Time.__day )
+        hours, seconds = divmod( seconds, Time.__hour )
+        minutes, seconds = divmod( seconds, Time.__minute )
+        years = int( years )
+        days = int( days )
+        hours = int( hours )
+        minutes = int( minutes )
         retstr = ""
         if years > 0:
             retstr += "{0:d} y ".format( years )
@@ -1411,6 +1414,8 @@ class Frequency( PObject ):
     Hz is that here we can drop the "Hz" as parameter during initialization. 
     """
 
+    __slots__ = ()
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor.
@@ -1451,6 +1456,8 @@ class Mass( PObject ):
     kg is that here we can drop the "kg" as parameter during initialization. 
     """
 
+    __slots__ = ()
+
     def __init__( self, value, *args, **kwargs ):
         """!
         @brief Constructor - use as
@@ -1505,6 +1512,8 @@ class Length( PObject ):
     the unit "ly".
     """
 
+    __slots__ = ()
+
     __lyConv = 9460730472580800
 
     def __init__( self, value, *args, **kwargs ):
@@ -1561,12 +1570,12 @@ class Length( PObject ):
         @brief Return a pretty string representing the object.
         @return string containing string representation of value and unit
         """
-        if self.value > self.__lyConv:
-            return SI.Prefix.toString( (self.value / self.__lyConv, "ly"), 
+        value = self.value
+        if value > self.__lyConv:
+            return SI.Prefix.toString( (value / self.__lyConv, "ly"), 
                                        self.digits,
                                        strictAscii=self._strictAscii )
-        else:
-            return super().__str__()
+        return super().__str__()
 
 
 
@@ -1588,8 +1597,37 @@ class ImperialLengthMisfits( PObject ):
     5 ' 7 " converts to 1 Yd 2 ' 7 " if useYards is set to True.
     """
 
-    # factor representing one inch in meters
+    __slots__ = ()
+
+    # factors representing one inch, mil, foot, yard, and mile in meters
     __INCH_FACTOR = 0.0254
+    __MIL_FACTOR = __INCH_FACTOR / 1000
+    __FOOT_FACTOR = __INCH_FACTOR * 12
+    __YARD_FACTOR = __FOOT_FACTOR * 3
+    __MILE_FACTOR = __YARD_FACTOR * 1760
+
+    # all accepted (upper case) spellings of the units and their factors - we
+    # note that we do not accept a lower case m as an abbreviation for Mile,
+    # all other units and their abbreviations are case insensitive
+    __unitFactors = {"''": __INCH_FACTOR, "\"": __INCH_FACTOR,
+                     "IN": __INCH_FACTOR, "INCH": __INCH_FACTOR,
+                     "INCHES": __INCH_FACTOR,
+                     "'": __FOOT_FACTOR, "FT": __FOOT_FACTOR,
+                     "FOOT": __FOOT_FACTOR, "FEET": __FOOT_FACTOR,
+                     "YARD": __YARD_FACTOR, "YARDS": __YARD_FACTOR,
+                     "YD": __YARD_FACTOR, "Y": __YARD_FACTOR,
+                     "YRD": __YARD_FACTOR,
+                     "MILE": __MILE_FACTOR, "MILES": __MILE_FACTOR,
+                     "MI": __MILE_FACTOR, "M": __MILE_FACTOR,
+                     "MIL": __MIL_FACTOR, "MILS": __MIL_FACTOR}
+
+    # units a length is broken down into (before the inches) in __str__
+    __breakdownUnits = (("mi", __MILE_FACTOR), ("ft", __FOOT_FACTOR))
+    __breakdownUnitsWithYards = (("mi", __MILE_FACTOR), ("yd", __YARD_FACTOR),
+                                 ("ft", __FOOT_FACTOR))
+
+    # number of post decimal point digits for precisions that are powers of 10
+    __decimalDigits = {10**k: k for k in range( 1, 16 )}
 
     def __init__( self, value, *args, **kwargs ):
         """!
@@ -1652,44 +1690,7 @@ class ImperialLengthMisfits( PObject ):
             super().__init__( value, *args, **kwargs )
             return
         if isinstance( value, str ):
-            valstr = value
-            if valstr.find( "'" ) != -1 and valstr.find( " '" ) == -1:
-                valstr = valstr.replace( "'", " '" )
-                valstr = valstr.replace( "' '", "''" )
-            if valstr.find( "\"" ) != -1 and valstr.find( " \"" ) == -1:
-                valstr = valstr.replace( "\"", " \"" )
-
-            value = 0
-            # if we were initialized with a string, we need to parse it
-            parts = valstr.strip().split( " " )
-            i = len( parts ) - 1
-            try:
-                while i > 0:
-                    factor = self.__unit2factor( parts[i] )
-                    i -= 1
-                    if factor == self.__INCH_FACTOR:
-                        # we allow fractions only for inches
-                        if parts[i].find( "/" ) != -1:
-                            fraction = parts[i].split( "/" )
-                            value += float( fraction[0] ) / \
-                                     float( fraction[1] ) * factor
-                            i -= 1
-                            try:
-                                value += float( parts[i] ) * factor
-                                i -= 1
-                            except ValueError:
-                                # there may only be a fraction and no number
-                                pass
-                        else:
-                            value += float( parts[i] ) * factor
-                            i -= 1
-                    else:
-                        # all other units are straightforward
-                        value += float( parts[i] ) * factor
-                        i -= 1
-            except ValueError as e:
-                raise ValueError( "Malformed string: " + valstr +
-                                  " ("+ str( e ) + ")" ) from e
+            value = self.__parse( value )
         elif len( args ) > 0:
             value *= self.__unit2factor( str( args[0] ) )
             args = args[1:]
@@ -1699,57 +1700,78 @@ class ImperialLengthMisfits( PObject ):
 
         # convert given precision either to internal power-of-2 precision
         # or to number of post decimal point digits
-        try:
-            kwargs["precision"] = int( round( 1 / kwargs["precision"] ) )
-            if bool( kwargs["precision"] & (kwargs["precision"] - 1) ):
-                # kwargs["precision"] is not power of 2
-                digits = math.log10( kwargs["precision"] )
-                if round( digits ) != digits:
+        if "precision" in kwargs:
+            precision = int( round( 1 / kwargs["precision"] ) )
+            if precision & (precision - 1):
+                # precision is not power of 2
+                digits = self.__decimalDigits.get( precision )
+                if digits is None:
                     raise ValueError( "ImperialLengthMisfits: precision must "
                                       "be inverse of power of 2 or power of "
                                       "10" )
-                kwargs["precision"] = None
-                kwargs["digits"] = round( digits )
-        except KeyError:
+                precision = None
+                kwargs["digits"] = digits
+            kwargs["precision"] = precision
+        else:
             kwargs["precision"] = 64
 
-        try:
-            kwargs["useYards"] = bool( kwargs["useYards"] )
-        except KeyError:
-            kwargs["useYards"] = False
+        kwargs["useYards"] = bool( kwargs.get( "useYards", False ) )
 
         super().__init__( value, "m", *args, **kwargs )
 
         return
 
 
+    def __parse( self, valstr ):
+        """!
+        @brief Parse a string with imperial length units into a length in m.
+        @param valstr string with any combination of imperial length units
+        @return length in m
+        """
+        if "'" in valstr and " '" not in valstr:
+            valstr = valstr.replace( "'", " '" ).replace( "' '", "''" )
+        if "\"" in valstr and " \"" not in valstr:
+            valstr = valstr.replace( "\"", " \"" )
+
+        # parse from the end, since every number is followed by its unit
+        value = 0
+        parts = valstr.strip().split( " " )
+        i = len( parts ) - 1
+        try:
+            while i > 0:
+                factor = self.__unit2factor( parts[i] )
+                number = parts[i - 1]
+                i -= 2
+                if factor == self.__INCH_FACTOR and "/" in number:
+                    # we allow fractions only for inches, and there may be
+                    # a whole number in front of the fraction
+                    fraction = number.split( "/" )
+                    value += float( fraction[0] ) / \
+                             float( fraction[1] ) * factor
+                    if i >= 0 and parts[i].strip().upper().rstrip( "." ) \
+                                  not in self.__unitFactors:
+                        value += float( parts[i] ) * factor
+                        i -= 1
+                else:
+                    value += float( number ) * factor
+        except ValueError as e:
+            raise ValueError( "Malformed string: " + valstr +
+                              " ("+ str( e ) + ")" ) from e
+
+        return value
+
+
     def __unit2factor( self, unit ):
         """!
         @brief Convert imperial misfit unit into metric conversion factor.
 
         Even the use of the units is not standardized, so we have to check for
-        all sorts of common uses.  We note that we do not accept a lower case
-        m as an abbreviation for Mile - all other units and their abbreviations
-        are case insensitive.
-        """
-        MILS_IN_INCH = 1000
-        INCHES_IN_FOOT = 12
-        FEET_IN_YARD = 3
-        YARDS_IN_MILE = 1760
-
-        u = unit.strip().upper().rstrip( "." )
-        if u in ("''", "\"", "IN", "INCH", "INCHES"):
-            return self.__INCH_FACTOR
-        if u in ("'", "FT", "FOOT", "FEET"):
-            return self.__INCH_FACTOR * INCHES_IN_FOOT
-        if u in("YARD", "YARDS", "YD", "Y", "YRD"):
-            return self.__INCH_FACTOR * INCHES_IN_FOOT * FEET_IN_YARD
-        if u in("MILE", "MILES", "MI", "M"):
-            return self.__INCH_FACTOR * INCHES_IN_FOOT * FEET_IN_YARD * \
-                   YARDS_IN_MILE
-        if u in ("MIL", "MILS"):
-            return self.__INCH_FACTOR / MILS_IN_INCH
-        raise ValueError( "Wrong unit encountered: " + unit )
+        all sorts of common uses.
+        """
+        try:
+            return self.__unitFactors[unit.strip().upper().rstrip( "." )]
+        except KeyError:
+            raise ValueError( "Wrong unit encountered: " + unit ) from None
 
 
     def __str__( self ):
@@ -1762,86 +1784,73 @@ class ImperialLengthMisfits( PObject ):
         constructor of this class.
         @return string containing string representation of value and unit
         """
-        valstring = ""
+        parts = []
+        precision = self._kwargs["precision"]
+        # smallest number of inches that is still represented in inches
+        if precision:
+            smallest = 1 / precision
+        else:
+            smallest = 1 / 64
 
-        if (self._kwargs["precision"] and \
-            self.value / self.__INCH_FACTOR < 1 / self._kwargs["precision"])\
-           or \
-           (self._kwargs["precision"] is None and \
-            self.value / self.__INCH_FACTOR < 1 / 64):
+        if self.value / self.__INCH_FACTOR < smallest:
             # first we take care of really small values that we represent in mil
-            if self._kwargs["precision"]:
+            if precision:
                 digits = 2
             else:
                 digits = self.digits
-            fstring = "{{0:.{0}f}} mil".format( digits )
-            return fstring.format( self.value / self.__unit2factor( "mil" ) )
+            return "{0:.{1}f} mil".format( self.value / self.__MIL_FACTOR,
+                                           digits )
 
-        if self._kwargs["precision"]:
-            tolerance = 1 / self._kwargs["precision"] * self.__INCH_FACTOR
+        if precision:
+            tolerance = smallest * self.__INCH_FACTOR
         else:
             tolerance = 10**(-self.digits) * self.__INCH_FACTOR
 
-        value = self.value
-        v = self.value // self.__unit2factor( "mi" )
-        if v > 0:
-            value = self.value % self.__unit2factor( "mi" )
-            if abs( value - self.__unit2factor( "mi" ) ) < tolerance:
-                if value < self.__unit2factor( "mi" ):
-                    v += 1
-                value = 0
-            valstring += str( int( v ) ) + " mi "
-
         if self._kwargs["useYards"]:
-            v = value // self.__unit2factor( "yd" )
-            if v > 0:
-                value %= self.__unit2factor( "yd" )
-                if abs( value - self.__unit2factor( "yd" ) ) < tolerance:
-                    if value < self.__unit2factor( "yd" ):
+            breakdownUnits = self.__breakdownUnitsWithYards
+        else:
+            breakdownUnits = self.__breakdownUnits
+
+        value = self.value
+        for name, factor in breakdownUnits:
+            # shorter lengths skip the larger units without dividing
+            if value >= factor:
+                v = value // factor
+                value %= factor
+                if abs( value - factor ) < tolerance:
+                    if value < factor:
                         v += 1
                     value = 0
-                valstring += str( int( v ) ) + " yd "
-
-        v = value // self.__unit2factor( "ft" )
-        if v > 0:
-            value %= self.__unit2factor( "ft" )
-            if abs( value - self.__unit2factor( "'" ) ) < tolerance:
-                if value < self.__unit2factor( "'" ):
-                    v += 1
-                value = 0
-            valstring += str( int( v ) ) + " ft "
+                parts.append( str( int( v ) ) + " " + name )
 
         # inches are "special" as they require fractions
         value = value / self.__INCH_FACTOR
-        if (self._kwargs["precision"] and \
-            value < 1 / self._kwargs["precision"]) or \
-           (self._kwargs["precision"] is None and value < 1 / 64):
-            return valstring
+        if value < smallest:
+            return " ".join( parts )
 
-        if self._kwargs["precision"]:
+        if precision:
             wholes = int( value )
             fraction = value - wholes
-            if fraction < 1 / self._kwargs["precision"]:
+            if fraction < smallest:
                 if wholes > 0:
-                    valstring += str( wholes ) + " in"
-            elif (1 - fraction) < 1 / self._kwargs["precision"]:
+                    parts.append( str( wholes ) + " in" )
+            elif (1 - fraction) < smallest:
                 wholes += 1
-                valstring += str( wholes ) + " in"
+                parts.append( str( wholes ) + " in" )
             else:
-                valstring += str( wholes )
-                precision = self._kwargs["precision"]
+                parts.append( str( wholes ) )
                 fraction = int( round( fraction * precision ) )
-                # cancel whatever we can cancel
-                while fraction > 1 and not bool( fraction & (fraction - 1) ):
-                    precision //= 2
-                    fraction //= 2
-                valstring += " " + str( fraction ) + "/" + \
-                                   str( precision ) + " in"
+                # cancel whatever we can cancel - precision is a power of 2,
+                # so the common factors are the trailing zero bits of fraction
+                shift = min( (fraction & -fraction).bit_length() - 1,
+                             precision.bit_length() - 1 )
+                fraction >>= shift
+                precision >>= shift
+                parts.append( str( fraction ) + "/" + str( precision ) + " in" )
         else:
-            fstring = "{{0:.{0}f}} in".format( self.digits )
-            valstring += fstring.format( value )
+            parts.append( "{0:.{1}f} in".format( value, self.digits ) )
 
-        return valstring.strip()
+        return " ".join( parts )
 
 
 
@@ -57,7 +57,10 @@
 #                   |                |
 
 
-import math
+from math import gcd, isqrt, floor, log10, copysign
+import functools
+
+__all__ = ['Unit', 'Prefix']
 
 
 class Unit():
@@ -101,6 +104,8 @@ class Unit():
     in addition to Ω.
     """
 
+    __slots__ = ("__numerator", "__denominator", "__strictAscii", "__string")
+
     # each of the SI base units is represented by a unique prime.
     __baseDict = {2:"m", 3:"kg", 5:"s", 7: "A", 11:"K", 13:"mol", 17:"cd"}
 
@@ -135,6 +140,9 @@ class Unit():
         (17, 4): "lx"
         }
 
+    # the rational number tuples for the unit names when parsing unit strings
+    __tokenDict = {name: tup for (tup, name) in __namesDict.items()}
+
     def __init__( self, unit, strictAscii=False ):
         """!
         @brief Constructor, takes a string (or a rational number tuple)
@@ -144,79 +152,123 @@ class Unit():
         @param unit base unit to be represented by this object
         @param strictAscii set to True to print "Ω" as "Ohm"
         """
-        if str != type( unit ) and tuple != type( unit ):
+        if type( unit ) is not str and type( unit ) is not tuple:
             raise ValueError( "SI.Unit only takes strings and tuples "
                               "as arguments" )
 
         self.__strictAscii = strictAscii
-
-        if tuple == type( unit ):
-            self.__numerator, self.__denominator = unit
+        # string representation, computed when first needed
+        self.__string = None
+
+        if type( unit ) is tuple:
+            numerator, denominator = unit
+            if 1 == numerator or 1 == denominator:
+                # nothing to cancel, which is common for (inverse) base units
+                self.__numerator = numerator
+                self.__denominator = denominator
+            else:
+                divisor = gcd( numerator, denominator )
+                self.__numerator = numerator // divisor
+                self.__denominator = denominator // divisor
         else:
-            # support scipy's way of indicating exponents
-            unit = unit.replace( "^", "**" )
-            if "Ohm" == unit: unit = "Ω"
-            if unit.count( "/" ) > 1:
-                raise ValueError( "Can only use one '/' - use parentheses "
-                                  "for numerator and denominator" )
-            unit = unit.replace( "(", "" ).replace( ")", "" )
-            self.__numerator = 1
-            self.__denominator = 1
-            numerator = True
-            for token in unit.split( " " ):
-                if "1" == token: continue
-                if "/" == token:
-                    numerator = False
-                    continue
-                if token.count( "**-" ) > 0:
-                    numerator = False
-                    token = token.replace( "**-", "**" )
-                pos = token.find( "**" )
-                if -1 == pos:
-                    power = 1
-                else:
-                    power = int( token[pos+2:] )
-                    token = token[:pos]
-
-                found = False
-                for (tup, name) in Unit.__namesDict.items():
-                    if name == token:
-                        num, den = tup
-                        if numerator:
-                            self.__numerator *= num**power
-                            self.__denominator *= den**power
-                        else:
-                            self.__numerator *= den**power
-                            self.__denominator *= num**power
-                        found = True
-                if not found:
-                    raise ValueError( "Unknown unit name specified: " + token )
-        
-        divisor = math.gcd( self.__numerator, self.__denominator )
-        self.__numerator //= divisor
-        self.__denominator //= divisor
-        
+            self.__numerator, self.__denominator = Unit.__parse( unit )
+
         return
 
 
+    @staticmethod
+    @functools.lru_cache( maxsize=256 )
+    def __parse( unit ):
+        """!
+        @brief Parse a unit string into the numerator and denominator of its
+        rational number representation.
+
+        Programs tend to use the same few unit strings over and over again, so
+        each of them is only parsed once.
+        @param unit string representing an SI unit
+        @return tuple with canceled numerator and denominator
+        """
+        # support scipy's way of indicating exponents
+        unit = unit.replace( "^", "**" )
+        if "Ohm" == unit: unit = "Ω"
+        if unit.count( "/" ) > 1:
+            raise ValueError( "Can only use one '/' - use parentheses "
+                              "for numerator and denominator" )
+        unit = unit.replace( "(", "" ).replace( ")", "" )
+        unitNumerator = 1
+        unitDenominator = 1
+        numerator = True
+        for token in unit.split( " " ):
+            if "1" == token: continue
+            if "/" == token:
+                numerator = False
+                continue
+            if token.count( "**-" ) > 0:
+                numerator = False
+                token = token.replace( "**-", "**" )
+            pos = token.find( "**" )
+            if -1 == pos:
+                power = 1
+            else:
+                power = int( token[pos+2:] )
+                token = token[:pos]
+
+            try:
+                num, den = Unit.__tokenDict[token]
+            except KeyError:
+                raise ValueError( "Unknown unit name specified: " +
+                                  token ) from None
+            if numerator:
+                unitNumerator *= num**power
+                unitDenominator *= den**power
+            else:
+                unitNumerator *= den**power
+                unitDenominator *= num**power
+
+        divisor = gcd( unitNumerator, unitDenominator )
+        return unitNumerator // divisor, unitDenominator // divisor
+
+
 
     def __str__( self ):
         """!
         @brief Return a pretty string representing the object.
+
+        Since units do not change once created, the string is only built once.
         @return string containing string representation of units
         """
-        if 1 == self.__numerator and 1 == self.__denominator: return ""
+        if self.__string is None:
+            self.__string = Unit.__toString( self.__numerator,
+                                             self.__denominator,
+                                             self.__strictAscii )
+        return self.__string
+
+
+    @staticmethod
+    @functools.lru_cache( maxsize=256 )
+    def __toString( numerator, denominator, strictAscii ):
+        """!
+        @brief Build the string representing a unit.
+
+        The strings are shared among all objects representing the same unit, so
+        that each of them is only built once, no matter how many objects are
+        created from, e.g., parsing the same unit string.
+        @param numerator numerator of the unit
+        @param denominator denominator of the unit
+        @param strictAscii set to True to use "Ohm" instead of "Ω"
+        @return string containing string representation of units
+        """
+        if 1 == numerator and 1 == denominator: return ""
         try:
-            return Unit.__namesDict[(self.__numerator, self.__denominator)]
+            return Unit.__namesDict[(numerator, denominator)]
         except KeyError:
             try:
                 retstrNum = "1"
-                retstrDen = Unit.__namesDict[(self.__denominator,
-                                               self.__numerator)]
+                retstrDen = Unit.__namesDict[(denominator, numerator)]
             except KeyError:
-                retstrNum = self.__components( self.__numerator )
+                retstrNum = Unit.__components( numerator )
                 if not retstrNum: retstrNum = "1"
-                retstrDen = self.__components( self.__denominator )
+                retstrDen = Unit.__components( denominator )
 
         if retstrDen:
             if 1 == len( retstrDen.split( " " ) ):
@@ -226,7 +278,7 @@ class Unit():
         else:
             retstr = retstrNum
 
-        if self.__strictAscii:
+        if strictAscii:
             retstr = retstr.replace( "Ω", "Ohm" )
 
         return retstr
@@ -241,44 +293,32 @@ class Unit():
                            str( self.__denominator ) + ") )"
 
            
-    def __components( self, n ):
+    @staticmethod
+    def __components( n ):
         """!
         @brief Private method to obtain components of a composite "unit."
 
-        Uses Euler's algorithm to compute prime factorization and then collects
-        equal elements to represent them as units raised to some power.
+        Divides n by the primes of the SI base units and represents each of
+        them as base unit raised to the power of its multiplicity.
         @param n integer representing composite SI unit
         @return string with all components
+        @throws ValueError if n has a prime factor that is not an SI base unit
         """
-        i = 2
-        components = ""
-        while i * i <= n:
-            if n % i:
-                i += 1
-            else:
-                n //= i
-                components += Unit.__baseDict[i] + " "
-        if n > 1:
-            components += Unit.__baseDict[n] + " "
-        components = components.strip()
-
-        l = components.split( " " )
-        index = 0
-        while index < len( l ) - 1:
-            if l[index+1] != l[index]:
-                index += 1
-                continue
-            item = l[index]
-            count = 1
-            index += 1
-            while l[index] == item:
+        components = []
+        for (prime, name) in Unit.__baseDict.items():
+            if 1 == n: break
+            count = 0
+            while 0 == n % prime:
+                n //= prime
                 count += 1
-                index += 1
-                if index >= len( l ): break
-            rs = ((item + " ") * count).strip()
-            components = components.replace( rs,
-                                             "{0}**{1}".format( item, count ) )
-        return components
+            if 1 == count:
+                components.append( name )
+            elif count > 1:
+                components.append( "{0}**{1}".format( name, count ) )
+        if 1 != n:
+            raise ValueError( "unit contains factor {0}, which is not made up "
+                              "of SI base units".format( n ) )
+        return " ".join( components )
 
 
 
@@ -311,17 +351,51 @@ class Unit():
 
 
 
+    @staticmethod
+    @functools.lru_cache( maxsize=256 )
+    def __fromTuple( num, den ):
+        """!
+        @brief Obtain the unit for a numerator and denominator.
+
+        Units do not change once created, so the results of unit arithmetic
+        can be shared among all PObjects with the same unit; calculations
+        repeated over many values thus create each resulting unit (and its
+        string) only once.
+        @param num numerator of the unit
+        @param den denominator of the unit
+        @return SI.Unit object for num / den
+        """
+        return Unit( (num, den) )
+
+
+    @staticmethod
+    @functools.lru_cache( maxsize=256 )
+    def fromString( string ):
+        """!
+        @brief Obtain the shared unit object for a unit string.
+
+        Units do not change once created, so all PObjects created with the
+        same unit string as well as all comparisons against that string, such
+        as the unit checks of the derived PObject classes, use the very same
+        unit object, which is only created (and parsed) once.
+        @param string unit string
+        @return SI.Unit object for string
+        """
+        return Unit( string )
+
+
+
     def __mul__( self, other ):
         """!
         @brief Overloading multiplication.
         @param other other SI.Unit object to multiply with
         @return SI.Unit object with multiplied units
         """
-        if Unit != type( other ):
+        if type( other ) is not Unit:
             raise ValueError( "can only multiply SI.Units with each other" )
         num = self.__numerator * other._numerator
         den = self.__denominator * other._denominator
-        return Unit( (num, den) )
+        return Unit.__fromTuple( num, den )
 
 
 
@@ -331,11 +405,11 @@ class Unit():
         @param other other SI.Unit object to divide this unit by
         @return SI.Unit object with divided units
         """
-        if Unit != type( other ):
+        if type( other ) is not Unit:
             raise ValueError( "can only divide SI.Units by each other" )
         num = self.__numerator * other._denominator
         den = self.__denominator * other._numerator
-        return Unit( (num, den) )
+        return Unit.__fromTuple( num, den )
 
 
 
@@ -345,7 +419,7 @@ class Unit():
         @param other other SI.Unit object to be divided by this unit
         @return SI.Unit object with divided units
         """
-        if Unit != type( other ) and other != 1:
+        if type( other ) is not Unit and other != 1:
             raise ValueError( "can only divide SI.Units by each other" )
         if 1 == other:
             den = int( self.__numerator )
@@ -353,7 +427,7 @@ class Unit():
         else:
             den = self.__numerator * other._denominator
             num = self.__denominator * other._numerator
-        return Unit( (num, den) )
+        return Unit.__fromTuple( num, den )
 
 
 
@@ -369,15 +443,34 @@ class Unit():
         @return SI.Unit object with raised to the power-th power
         """
         if 1 == self.__numerator and 1 == self.__denominator: return self
+        if 1 == power: return self
+
+        if type( power ) is not int and int( power ) == power:
+            power = int( power )
 
-        if power >= 1 and int( power ) == power:
-            num = self.__numerator**int( power )
-            den = self.__denominator**int( power )
-        elif power <= -1 and int( power ) == power:
-            den = self.__numerator**int( power )
-            num = self.__denominator**int( power )
-        elif power == 0:
-            return (1, 1)
+        if type( power ) is int:
+            # integer powers, such as squares and inverses, always succeed
+            if power >= 0:
+                num = self.__numerator**power
+                den = self.__denominator**power
+            else:
+                num = self.__denominator**(-power)
+                den = self.__numerator**(-power)
+            return Unit.__fromTuple( num, den )
+        elif 0.5 == abs( power ):
+            # square roots (as in sqrt()) can be taken exactly with integers
+            num = isqrt( self.__numerator )
+            den = isqrt( self.__denominator )
+            if num * num != self.__numerator or \
+               den * den != self.__denominator:
+                if power > 0:
+                    raise ValueError( "Cannot compute square root of "
+                                      "unit {0}".format( self ) )
+                raise ValueError( "Cannot compute {0}-th power of "
+                                  "unit {1}".format( power, self ) )
+            if power < 0:
+                (num, den) = (den, num)
+            return Unit.__fromTuple( num, den )
         elif power > 0:
             num = self.__numerator**power
             den = self.__denominator**power
@@ -394,7 +487,7 @@ class Unit():
                 raise ValueError( "Cannot compute {0}-th power of "
                                   "unit {1}".format( power, self ) )
 
-        return Unit( (int( num ), int( den )) )
+        return Unit.__fromTuple( int( num ), int( den ) )
 
 
 
@@ -404,11 +497,12 @@ class Unit():
         @param other other SI.Unit object to be checked against
         @return True or False
         """
-        if isinstance( other, Unit ):
-            pass
-        elif str == type( other ):
-            other = Unit( other )
-        else:
+        if other is self:
+            # units are immutable and often shared between objects
+            return True
+        if type( other ) is str:
+            other = Unit.fromString( other )
+        elif not isinstance( other, Unit ):
             raise ValueError( "can only compare Unit with other Unit" )
         return self.__numerator == other._numerator and \
                self.__denominator == other._denominator
@@ -422,11 +516,11 @@ class Unit():
         @param other other SI.Unit object to be checked against
         @return True or False
         """
-        if isinstance( other, Unit ):
-            pass
-        elif str == type( other ):
-            other = Unit( other )
-        else:
+        if other is self:
+            return False
+        if type( other ) is str:
+            other = Unit.fromString( other )
+        elif not isinstance( other, Unit ):
             raise ValueError( "can only compare Unit with other Unit" )
         return self.__numerator != other._numerator or \
                self.__denominator != other._denominator
@@ -485,6 +579,27 @@ class Prefix():
     instantiated.
     """
 
+    # powers of ten of the prefixes accepted as input
+    __powers = {"q":-30, "r":-27, "y":-24, "z":-21, "a":-18, "f":-15,
+                "p":-12, "n":-9, "u":-6, "μ":-6, "m":-3, "c":-2, "":0,
+                "k":3, "M":6, "G":9, "T":12, "P":15, "E":18, "Z":21, "Y":24,
+                "R":27, "Q":30}
+
+    # prefixes for powers of ten used for output
+    __prefixes = {-30:"q", -27:"r", -24:"y", -21:"z", -18:"a", -15:"f",
+                  -12:"p", -9:"n", -6:"μ", -3:"m", -2:"c", 0:"", 3:"k",
+                  6:"M", 9:"G", 12:"T", 15:"P", 18:"E", 21:"Z", 24:"Y",
+                  27:"R", 30:"Q"}
+    __asciiPrefixes = dict( __prefixes )
+    __asciiPrefixes[-6] = "u"
+
+    # factors for the powers of ten covered by the prefixes - computed like
+    # 10**power would be in the arithmetic below
+    __decades = {power: float( 10**power ) for power in range( -30, 31 )}
+
+    # multi-character units whose first character is not a prefix
+    __unprefixedUnits = frozenset( ("kg", "cal", "mol", "cd") )
+
 
     @staticmethod
     def toString( valueTuple, digits=3, formatSpec=None, strictAscii=False ):
@@ -500,7 +615,7 @@ class Prefix():
         @return formatted string containing number and unit with SI prefix
         """
 
-        if not tuple == type( valueTuple ):
+        if type( valueTuple ) is not tuple:
             raise ValueError( "toString() requires (value, unit) tuple "
                               "as argument" )
 
@@ -513,22 +628,22 @@ class Prefix():
                 # difference to next integer
                 delta = abs( round( newval ) - newval )
                 predigits = max( 0,
-                                 math.floor( math.log10( abs( newval ) ) ) + 1 )
+                                 floor( log10( abs( newval ) ) ) + 1 )
                 postdigits = max( 0, digits - predigits )
 
                 if abs( newval ) > 1 and delta <= 5 * 10**(-postdigits - 1):
                     # we've got something close enough to an integer
                     newval = round( newval )
                     fstring = "{0} {1}"
+                elif abs( newval ) > 1.e27 or abs( newval ) < 1.e-24:
+                    fstring = "{0:.{2}g} {1}"
                 else:
-                    if abs( newval ) > 1.e27 or abs( newval ) < 1.e-24:
-                        fstring = "{{0:.{0}g}} {{1}}".format( postdigits )
-                    else:
-                        fstring = "{{0:.{0}f}} {{1}}".format( postdigits )
+                    fstring = "{0:.{2}f} {1}"
             else:
                 fstring = "{0:g} {1}"
+                postdigits = None
 
-            return fstring.format( newval, unit )
+            return fstring.format( newval, unit, postdigits )
 
 
     @staticmethod
@@ -544,19 +659,14 @@ class Prefix():
         @return tuple with number and base unit
         """
 
-        try:
-            tokenList = string.split( " " )
-        except ValueError:
-            tokenList = [string]
+        (number, separator, unit) = string.partition( " " )
 
-        if len( tokenList ) == 1:
-            number = float( string )
-            return (number, "")
-        if len( tokenList ) != 2:
+        if not separator:
+            return (float( string ), "")
+        if " " in unit:
             raise ValueError( "SI.fromString: malformed string: " + string )
 
-        return Prefix.normalizeTuple( (float( tokenList[0] ), tokenList[1]),
-                                      strictAscii )
+        return Prefix.normalizeTuple( (float( number ), unit), strictAscii )
 
 
 
@@ -573,25 +683,74 @@ class Prefix():
         @param strictAscii set True to get only 8-bit ASCII characters
         @return (value, baseUnit) tuple where baseUnit is an SI base unit
         """
-        prefixes = {"q":-30, "r":-27, "y":-24, "z":-21, "a":-18, "f":-15,
-                    "p":-12, "n":-9, "u":-6, "μ":-6, "m":-3, "c":-2, "":0,
-                    "k":3, "M":6, "G":9, "T":12, "P":15, "E":18, "Z":21, "Y":24,
-                    "R":27, "Q":30}
-
         (value, unit) = valueTuple
 
-        if int == type( value ):
+        if type( value ) is int:
             value = float( value )
 
-        if Unit == type( unit ):
+        if type( unit ) is Unit:
             unit = str( unit )
 
         if not isinstance( value, float ) or not isinstance( unit, str ):
             raise ValueError( "wrong data types supplied in valueTuple" )
 
-        unit = unit.strip()
-        if len( unit ) > 1 and \
-           "kg" != unit and "cal" != unit and "mol" != unit and "cd" != unit:
+        (decade, kgFactor, kgDivisor, baseUnit) = \
+            Prefix.__splitUnit( unit.strip(), strictAscii )
+
+        return (value * decade * kgFactor / kgDivisor, baseUnit)
+
+
+
+    @staticmethod
+    def normalizeList( values, unit, strictAscii=False ):
+        """!
+        @brief Normalize a list of values that share the same unit to values
+               with the base unit without prefix.
+
+        Same as calling normalizeTuple() for each value, but the unit is only
+        analyzed once for the entire list.
+        @param values list of numbers
+        @param unit unit of all values that may or may not be an SI base unit
+        @param strictAscii set True to get only 8-bit ASCII characters
+        @return (values, baseUnit) tuple with a list of normalized values and
+                the SI base unit
+        """
+        if type( unit ) is Unit:
+            unit = str( unit )
+
+        if not isinstance( unit, str ):
+            raise ValueError( "wrong data type supplied for unit" )
+
+        (decade, kgFactor, kgDivisor, baseUnit) = \
+            Prefix.__splitUnit( unit.strip(), strictAscii )
+
+        result = []
+        for value in values:
+            if type( value ) is int:
+                value = float( value )
+            elif not isinstance( value, float ):
+                raise ValueError( "wrong data type supplied in values: "
+                                  "{0}".format( value ) )
+            result.append( value * decade * kgFactor / kgDivisor )
+
+        return (result, baseUnit)
+
+
+
+    @staticmethod
+    @functools.lru_cache( maxsize=256 )
+    def __splitUnit( unit, strictAscii ):
+        """!
+        @brief Split a (stripped) unit string into its prefix and base unit.
+
+        Programs tend to use the same few units over and over again, so each
+        of them is only analyzed once.
+        @param unit unit that may or may not be an SI base unit
+        @param strictAscii set True to get only 8-bit ASCII characters
+        @return (decade, kgFactor, kgDivisor, baseUnit) tuple - the value in
+                the base unit is value * decade * kgFactor / kgDivisor
+        """
+        if len( unit ) > 1 and unit not in Prefix.__unprefixedUnits:
             baseUnit = unit[1:]
             prefix = unit[0]
         else:
@@ -604,24 +763,25 @@ class Prefix():
             baseUnit = prefix + baseUnit
             prefix = ""
             
-        try:
-            power = prefixes[prefix]
-        except KeyError:
+        power = Prefix.__powers.get( prefix )
+        if power is None:
             # likely mistaken unit for prefix - then there is no prefix
             baseUnit = unit
             power = 0
 
-        number = float( value ) * 10**power
+        decade = Prefix.__decades[power]
+        kgFactor = 1.
+        kgDivisor = 1.
 
         if baseUnit:
             # internally, all units are strictly mksA SI units,
             # i.e. g and t are converted to kg
             if "t" == baseUnit:
                 baseUnit = "kg"
-                number *= 1000.
+                kgFactor = 1000.
             elif "g" == baseUnit:
                 baseUnit = "kg"
-                number /= 1000.
+                kgDivisor = 1000.
 
             # whether we allow "Ω" as base unit depends on the setting of
             # strictAscii
@@ -630,7 +790,7 @@ class Prefix():
             elif "Ohm" == baseUnit and not strictAscii:
                 baseUnit = "Ω"
 
-        return (number, baseUnit)
+        return (decade, kgFactor, kgDivisor, baseUnit)
 
 
 
@@ -654,15 +814,9 @@ class Prefix():
         """
 
         if strictAscii:
-            prefixes = {-30:"q", -27:"r", -24:"y", -21:"z", -18:"a", -15:"f",
-                        -12:"p", -9:"n", -6:"u", -3:"m", -2:"c", 0:"", 3:"k",
-                        6:"M", 9:"G", 12:"T", 15:"P", 18:"E", 21:"Z", 24:"Y",
-                        27:"R", 30:"Q"}
+            prefixes = Prefix.__asciiPrefixes
         else:
-            prefixes = {-30:"q", -27:"r", -24:"y", -21:"z", -18:"a", -15:"f",
-                        -12:"p", -9:"n", -6:"μ", -3:"m", -2:"c", 0:"", 3:"k",
-                        6:"M", 9:"G", 12:"T", 15:"P", 18:"E", 21:"Z", 24:"Y",
-                        27:"R", 30:"Q"}
+            prefixes = Prefix.__prefixes
 
         (number, baseUnit) = Prefix.normalizeTuple( valueTuple, strictAscii )
 
@@ -670,10 +824,10 @@ class Prefix():
             return (number, baseUnit)
 
         absval = abs( number )
-        sign = math.copysign( 1, number )
+        sign = copysign( 1, number )
 
         try:
-            power10 = math.floor( math.log10( absval ) )
+            power10 = floor( log10( absval ) )
         except ValueError:
             # fall back to "g-formatting" in case the number is close enough to
             # 0 to cause a ValueError exception here
@@ -701,7 +855,10 @@ class Prefix():
             # if we cannot represent the mass with standard prefixes, we resort
             # to representing it as "kg" and powers of 10
 
-        newval = absval / 10**prefixIndex * sign
+        decade = Prefix.__decades.get( prefixIndex )
+        if decade is None:
+            decade = 10**prefixIndex
+        newval = absval / decade * sign
 
         if integerBits is not None:
             if integerBits < 0:
@@ -66,20 +66,72 @@
 #   Tue Jan 28 2025 | Ekkehard Blanz | added __version__ and __all__
 #                   |                |
 
-from .SI import Unit, Prefix
-from .PObject import sqrt, PObject, Energy, Temperature, Time, Mass, Length, \
-                     Frequency, ImperialLengthMisfits
-from .ESeries import ESeries
-from .EEObjects import EEObject, Voltage, Current, \
-                       Resistor, Capacitor, Inductor
-from .EEIterators import Erange, Rrange, Crange, Lrange
-from .Const import Const
+import sys as _sys
+import types as _types
+
+from .SI import *
+from .PObject import *
+from .ESeries import *
+from .EEObjects import *
+from .EEIterators import *
 
 
 
 __version__ = '2.0.0'
-#__all__ = ['Const', 'Unit', 'Prefix', 'sqrt', 'PObject', 'Energy',
-#           'Temperature', 'Time', 'Mass', 'Length', 'Frequency',
-#           'ImperialLengthMisfits', 'ESeries', 'EEObject', 'Voltage', 'Current',
-#           'Resistor', 'Capacitor', 'Inductor', 'Erange', 'Rrange', 'Crange',
-#           'Lrange']
+__all__ = ['Const', 'Unit', 'Prefix', 'sqrt', 'PObject', 'Energy',
+           'Temperature', 'Time', 'Mass', 'Length', 'Frequency',
+           'ImperialLengthMisfits', 'ESeries', 'EEObject', 'Voltage', 'Current',
+           'Resistor', 'Capacitor', 'Inductor', 'Erange', 'Rrange', 'Crange',
+           'Lrange']
+
+
+class _Package( _types.ModuleType ):
+    """!
+    @brief Module type of this package that keeps the name Const bound to the
+    class Const.
+
+    Whenever the submodule Const is imported - lazily by __getattr__() below or
+    explicitly as in "from PObjects.Const import Const" - the import system
+    binds the submodule to the name Const in this package, which would hide the
+    class of the same name.
+    """
+
+    def __setattr__( self, name, value ):
+        """!
+        @brief Bind the class Const instead of the submodule Const.
+        @param name name of the attribute to set
+        @param value value of the attribute
+        """
+        if "Const" == name and isinstance( value, _types.ModuleType ):
+            value = value.Const
+        super().__setattr__( name, value )
+
+
+
+_sys.modules[__name__].__class__ = _Package
+del _Package
+
+
+def __getattr__( name ):
+    """!
+    @brief Import Const only when it is first used.
+
+    Const gets its values from scipy, whose import takes far longer than that
+    of everything else in this package together, so programs that do not use
+    any physical constants do not have to pay for it.
+    @param name name of the attribute requested from this package
+    @return the requested attribute
+    """
+    if "Const" == name:
+        from .Const import Const
+        return Const
+    raise AttributeError( "module {0} has no attribute {1}"
+                          .format( __name__, name ) )
+
+
+def __dir__():
+    """!
+    @brief List the attributes of this package including Const.
+    @return sorted list of attribute names
+    """
+    return sorted( set( globals() ) | {"Const"} )
@@ -5,10 +5,11 @@ Setup script for PObjects package
 
 from setuptools import setup
 import os
-description = open( os.path.join( os.path.dirname( __file__ ),
-                                  'PObjects',
-                                  'README.md'),
-                    'r').read()
+with open( os.path.join( os.path.dirname( __file__ ),
+                        'PObjects',
+                        'README.md' ),
+           'r', encoding='utf-8' ) as readme:
+    description = readme.read()
 setup(
     name = "PObjects",
     packages = ["PObjects"],
@@ -23,8 +24,7 @@ setup(
     url = "https://github.com/Ekkehard/PObjects.git",
     keywords = ["Physical Computing", "Engineering", "SI Units"],
     install_requires=[
-        "setuptools", 
-        "gpiod >= 2.2"],
+        "setuptools"],
     license='LICENSE.md',
     classifiers = [
         "Programming Language :: Python",
@@ -0,0 +1,94 @@
+# Python Implementation: test_Const
+# -*- coding: utf-8 -*-
+##
+# @file       test_Const.py
+#
+# @par Purpose
+#             Unit Tests for obtaining Const from the PObjects package.
+#
+# @par Comments
+#             Each test runs in a fresh interpreter, since which modules have
+#             already been imported is exactly what is being tested.  Like all
+#             Unit Tests of this package, this script expects to reside in the
+#             package directory PObjects and is run by "make check".
+#
+# @par
+#             This is Python 3 code!
+
+import os
+import subprocess
+import sys
+import unittest
+
+
+# directory containing the PObjects package directory
+_root = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+
+
+def _run( code ):
+    """!
+    @brief Run code in a fresh interpreter that can import PObjects.
+    @param code Python code to run
+    @return standard output of the code, stripped
+    """
+    env = dict( os.environ )
+    env["PYTHONPATH"] = os.pathsep.join(
+                            filter( None, [_root, env.get( "PYTHONPATH" )] ) )
+    result = subprocess.run( [sys.executable, "-c", code], env=env,
+                             capture_output=True, text=True, check=True )
+    return result.stdout.strip()
+
+
+class TestConst( unittest.TestCase ):
+
+    def test_constIsClassAfterImportingSubmodule( self ):
+        self.assertEqual( "True",
+                          _run( "import PObjects.Const\n"
+                                "import PObjects\n"
+                                "print( isinstance( PObjects.Const, "
+                                "type ) )" ) )
+
+
+    def test_constIsClassAfterImportingFromSubmodule( self ):
+        self.assertEqual( "True",
+                          _run( "from PObjects.Const import Const\n"
+                                "from PObjects import Const as C\n"
+                                "print( C is Const )" ) )
+
+
+    def test_constIsImportedLazily( self ):
+        self.assertEqual( "False True",
+                          _run( "import sys\n"
+                                "import PObjects\n"
+                                "loaded = 'PObjects.Const' in sys.modules\n"
+                                "print( loaded, "
+                                "isinstance( PObjects.Const, type ) )" ) )
+
+
+    def test_noHelpersInPackageNamespace( self ):
+        self.assertEqual( "False False False",
+                          _run( "import PObjects\n"
+                                "print( *(hasattr( PObjects, name ) for name "
+                                "in ('sys', 'types', '_Package')) )" ) )
+
+
+    def test_unknownConstantMessage( self ):
+        self.assertEqual( "type object 'Const' has no attribute 'foo'",
+                          _run( "from PObjects import Const\n"
+                                "try:\n"
+                                "    Const.foo\n"
+                                "except AttributeError as e:\n"
+                                "    print( e )" ) )
+
+
+    def test_constantsAreNotShared( self ):
+        self.assertEqual( "False",
+                          _run( "from PObjects import Const\n"
+                                "x = Const.c_0\n"
+                                "x *= 2\n"
+                                "print( x == Const.c_0 )" ) )
+
+
+
+if "__main__" == __name__:
+    unittest.main()
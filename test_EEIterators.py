@@ -0,0 +1,71 @@
+# Python Implementation: test_EEIterators
+# -*- coding: utf-8 -*-
+##
+# @file       test_EEIterators.py
+#
+# @par Purpose
+#             Unit Tests for the EEIterators module of the PObjects package.
+#
+# @par Comments
+#             Like all Unit Tests of this package, this script expects to
+#             reside in the package directory PObjects and is run by
+#             "make check".
+#
+# @par
+#             This is Python 3 code!
+
+import itertools
+import os
+import sys
+import unittest
+
+# the directory containing the package directory PObjects
+sys.path.insert( 0, os.path.dirname( os.path.dirname(
+                                            os.path.abspath( __file__ ) ) ) )
+from PObjects import Erange, Rrange, Crange, PObject, Resistor, Capacitor
+
+
+class TestErange( unittest.TestCase ):
+
+    def test_openEndedRangeCanBeSliced( self ):
+        values = [r.value for r in
+                  itertools.islice( Erange( 100, float( "inf" ), "Ω" ), 4 )]
+        self.assertEqual( [100., 120., 150., 180.], values )
+
+
+    def test_openEndedRangeIsReversible( self ):
+        values = [r.value for r in
+                  itertools.islice( Erange( 100, -float( "inf" ), "Ω" ), 3 )]
+        self.assertEqual( [100., 82., 68.], values )
+
+
+    def test_valuesOfOpenEndedRangeRaise( self ):
+        with self.assertRaises( ValueError ):
+            Erange( 1, float( "inf" ), "Ω" ).values
+
+
+    def test_valuesMatchIteration( self ):
+        for erange in (Erange( 100, 1000, "Ω" ),
+                       Erange( 1000, 100, "Ω" ),
+                       Erange( 95, 1050, "Ω" ),
+                       Erange( 470, 470, "Ω" ),
+                       Erange( PObject( "1 kΩ" ), PObject( "2 kΩ" ), "Ω",
+                               series="E24" ),
+                       Rrange( Resistor( 1000 ), Resistor( 4700 ) ),
+                       Crange( Capacitor( "1 nF" ), Capacitor( "10 nF" ) )):
+            values = erange.values
+            self.assertEqual( [obj.value for obj in erange], values )
+            for value in values:
+                self.assertIs( float, type( value ) )
+
+
+    def test_values( self ):
+        self.assertEqual( [1000., 1100., 1200., 1300., 1500., 1600., 1800.,
+                           2000.],
+                          Erange( 1000, 2000, "Ω", series="E24" ).values )
+        self.assertEqual( [470.], Erange( 470, 470, "Ω" ).values )
+
+
+
+if "__main__" == __name__:
+    unittest.main()
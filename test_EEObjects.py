@@ -0,0 +1,74 @@
+# Python Implementation: test_EEObjects
+# -*- coding: utf-8 -*-
+##
+# @file       test_EEObjects.py
+#
+# @par Purpose
+#             Unit Tests for the EEObjects module of the PObjects package.
+#
+# @par Comments
+#             Like all Unit Tests of this package, this script expects to
+#             reside in the package directory PObjects and is run by
+#             "make check".
+#
+# @par
+#             This is Python 3 code!
+
+import math
+import os
+import sys
+import unittest
+
+# the directory containing the package directory PObjects
+sys.path.insert( 0, os.path.dirname( os.path.dirname(
+                                            os.path.abspath( __file__ ) ) ) )
+from PObjects import ESeries, Resistor, Capacitor, Inductor
+
+
+class TestSeriesNeighbors( unittest.TestCase ):
+
+    def objects( self ):
+        return (Resistor( 470, digits=2 ),
+                Resistor( 1000, series="E24", strictAscii=True ),
+                Capacitor( 4.7e-9, "F" ),
+                Inductor( 10e-6, series="E24", digits=4 ))
+
+
+    def assertLike( self, obj, result, value ):
+        self.assertIs( type( obj ), type( result ) )
+        self.assertEqual( obj.series, result.series )
+        self.assertEqual( obj.unit, result.unit )
+        self.assertEqual( obj._kwargs, result._kwargs )
+        self.assertEqual( obj._args, result._args )
+        self.assertTrue( math.isclose( value, result.value, rel_tol=1e-12 ) )
+        # the result can be recreated by its own class with its own arguments
+        copy = type( result )( result.value, *result._args, **result._kwargs )
+        self.assertEqual( str( result ), str( copy ) )
+        self.assertEqual( result.series, copy.series )
+
+
+    def test_next( self ):
+        for obj in self.objects():
+            self.assertLike( obj, obj.next(),
+                             ESeries.next( obj.value, obj.series ) )
+
+
+    def test_previous( self ):
+        for obj in self.objects():
+            self.assertLike( obj, obj.previous(),
+                             ESeries.previous( obj.value, obj.series ) )
+
+
+    def test_decade( self ):
+        for obj in self.objects():
+            vlist = ESeries.decade( obj.value, obj.series, decades=2,
+                                    sorted=True )
+            olist = obj.decade( decades=2, sorted=True )
+            self.assertEqual( len( vlist ), len( olist ) )
+            for value, result in zip( vlist, olist ):
+                self.assertLike( obj, result, value )
+
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,130 @@
+# Python Implementation: test_ESeries
+# -*- coding: utf-8 -*-
+##
+# @file       test_ESeries.py
+#
+# @par Purpose
+#             Unit Tests for the ESeries module of the PObjects package.
+#
+# @par Comments
+#             Like all Unit Tests of this package, this script expects to
+#             reside in the package directory PObjects and is run by
+#             "make check".
+#
+# @par
+#             This is Python 3 code!
+
+import math
+import os
+import sys
+import unittest
+
+# the directory containing the package directory PObjects
+sys.path.insert( 0, os.path.dirname( os.path.dirname(
+                                            os.path.abspath( __file__ ) ) ) )
+from PObjects import ESeries
+
+
+class TestClosest( unittest.TestCase ):
+
+    def test_valueInSeriesIsReturnedAsFloat( self ):
+        for value in (470, 470., 1, 8.2):
+            result = ESeries.closest( value, "E12" )
+            self.assertEqual( value, result )
+            self.assertIs( float, type( result ) )
+
+
+    def test_closestList( self ):
+        values = (470, 9.9, 0.0099, 1.1e-9, 3.3e6, 500)
+        for series in ("E12", "E96", [1.0, 2.0, 5.0]):
+            self.assertEqual( [ESeries.closest( value, series )
+                               for value in values],
+                              ESeries.closestList( values, series ) )
+        # also takes iterators
+        self.assertEqual( [4.7, 10.],
+                          ESeries.closestList( iter( (4.5, 9.9) ), "E12" ) )
+        self.assertEqual( [4.5, 9.9],
+                          ESeries.closestList( iter( (4.5, 9.9) ), None ) )
+        self.assertEqual( [], ESeries.closestList( [], "E12" ) )
+
+
+
+class TestDecadeEdges( unittest.TestCase ):
+
+    # custom series spanning one decade
+    custom = [1.0, 2.0, 5.0]
+
+
+    def assertClose( self, expected, result ):
+        self.assertTrue( math.isclose( expected, result, rel_tol=1e-12 ),
+                         "{0} != {1}".format( expected, result ) )
+
+
+    def test_closestAtDecadeEdges( self ):
+        for series, value, expected in (("E12", 9.9, 10.),
+                                        ("E12", 0.0099, 0.01),
+                                        ("E12", 10., 10.),
+                                        (self.custom, 9.9, 10.),
+                                        (self.custom, 8.2, 10.),
+                                        (self.custom, 0.0099, 0.01)):
+            self.assertClose( expected, ESeries.closest( value, series ) )
+
+
+    def test_nextAtDecadeEdges( self ):
+        for series, value, expected in (("E12", 8.2, 10.),
+                                        ("E12", 9.9, 10.),
+                                        ("E12", 10., 12.),
+                                        ("E12", 1000, 1200.),
+                                        (self.custom, 5., 10.),
+                                        (self.custom, 9.9, 10.),
+                                        (self.custom, 10., 20.)):
+            self.assertClose( expected, ESeries.next( value, series ) )
+
+
+    def test_previousAtDecadeEdges( self ):
+        for series, value, expected in (("E12", 1., 0.82),
+                                        ("E12", 10., 8.2),
+                                        ("E12", 1000, 820.),
+                                        ("E12", 0.0099, 0.0082),
+                                        (self.custom, 1., 0.5),
+                                        (self.custom, 10., 5.),
+                                        (self.custom, 1.1, 1.)):
+            self.assertClose( expected, ESeries.previous( value, series ) )
+
+
+class TestDecade( unittest.TestCase ):
+
+    def test_valuesAreUniqueAcrossDecadeBoundaries( self ):
+        for value in (1., 10, 3., 4.7e-6, 5e-6, 8.2e3):
+            vlist = ESeries.decade( value, "E12", decades=2 )
+            self.assertEqual( 24, len( vlist ) )
+            # compare rounded to significant digits to catch values that only
+            # differ by rounding errors
+            self.assertEqual( 24, len( {float( "{0:.10g}".format( v ) )
+                                        for v in vlist} ) )
+            for v in vlist:
+                self.assertTrue( math.isclose( v, ESeries.closest( v, "E12" ),
+                                               rel_tol=1e-12 ) )
+
+
+class TestSeriesNames( unittest.TestCase ):
+
+    def test_alternativeSpellings( self ):
+        table = ESeries._ESeries__seriesIndex
+        size = len( table )
+        for series in ("E12", "e12", 12, "12", "0012"):
+            self.assertEqual( 12, ESeries.len( series ) )
+            self.assertEqual( 0.1, ESeries.tolerance( series ) )
+        # alternative spellings must not be added to the table
+        self.assertEqual( size, len( table ) )
+
+
+    def test_wrongNameRaises( self ):
+        for series in ("E13", "13", "x", 13):
+            with self.assertRaises( ValueError ):
+                ESeries.len( series )
+
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,169 @@
+# Python Implementation: test_PObject
+# -*- coding: utf-8 -*-
+##
+# @file       test_PObject.py
+#
+# @par Purpose
+#             Unit Tests for the PObject module of the PObjects package.
+#
+# @par Comments
+#             Like all Unit Tests of this package, this script expects to
+#             reside in the package directory PObjects and is run by
+#             "make check".
+#
+# @par
+#             This is Python 3 code!
+
+import array
+import os
+import sys
+import unittest
+
+# the directory containing the package directory PObjects
+sys.path.insert( 0, os.path.dirname( os.path.dirname(
+                                            os.path.abspath( __file__ ) ) ) )
+from PObjects import SI, PObject, ImperialLengthMisfits
+
+
+class TestPower( unittest.TestCase ):
+
+    def test_powerOfZero( self ):
+        result = PObject( 3, "m" )**0
+        self.assertEqual( 1.0, result )
+        self.assertIs( float, type( result ) )
+
+
+    def test_integerPowers( self ):
+        for power, value, unit in ((1, 4., "m**2"),
+                                   (2, 16., "m**4"),
+                                   (2.0, 16., "m**4"),
+                                   (-1, 0.25, (1, 4)),
+                                   (-2, 0.0625, (1, 16))):
+            result = PObject( 4, "m**2" )**power
+            self.assertIs( PObject, type( result ) )
+            self.assertEqual( value, result.value )
+            self.assertEqual( SI.Unit( unit ), result.unit )
+
+
+    def test_squareRoots( self ):
+        for power, value, unit in ((0.5, 2., "m"), (-0.5, 0.5, (1, 2))):
+            result = PObject( 4, "m**2" )**power
+            self.assertEqual( value, result.value )
+            self.assertEqual( SI.Unit( unit ), result.unit )
+        for power in (0.5, -0.5):
+            with self.assertRaises( ValueError ):
+                PObject( 4, "m" )**power
+
+
+class TestFloatArray( unittest.TestCase ):
+
+    def test_valuesInBaseUnits( self ):
+        polist = [PObject( "1 kΩ" ), PObject( "2 mA" ), 0, PObject( 3, "m" )]
+        result = PObject.floatArray( polist )
+        self.assertIsInstance( result, array.array )
+        self.assertEqual( "d", result.typecode )
+        self.assertEqual( PObject.floatList( polist ), result.tolist() )
+        self.assertEqual( 0, len( PObject.floatArray( [] ) ) )
+
+
+    def test_otherElementsRaise( self ):
+        with self.assertRaises( ValueError ):
+            PObject.floatArray( [PObject( "1 kΩ" ), 1] )
+
+
+class TestStandardizedList( unittest.TestCase ):
+
+    def test_mixedPrefixes( self ):
+        self.assertEqual( ([1., 4.7, 2.2], "kΩ"),
+                          PObject.standardizedList( [PObject( "1 kΩ" ),
+                                                     PObject( "4.7 kΩ" ),
+                                                     PObject( 2200, "Ω" )] ) )
+
+
+    def test_prefixesTooFarApart( self ):
+        # no common prefix - values are returned with the base unit
+        self.assertEqual( ([1000., 4.7e6, 470.], SI.Unit( "Ω" )),
+                          PObject.standardizedList( [PObject( "1 kΩ" ),
+                                                     PObject( "4.7 MΩ" ),
+                                                     PObject( 470, "Ω" )] ) )
+
+
+    def test_zerosAndNegativeValues( self ):
+        self.assertEqual( ([0, 2.2, -4.7, 3.3], "nF"),
+                          PObject.standardizedList( [0,
+                                                     PObject( "2.2 nF" ),
+                                                     PObject( "-4.7 nF" ),
+                                                     PObject( 3.3e-9, "F" )] ) )
+        self.assertEqual( ([10., -2., 0], "mA"),
+                          PObject.standardizedList( [PObject( "10 mA" ),
+                                                     PObject( "-2 mA" ),
+                                                     0] ) )
+        self.assertEqual( ([0, 0], ""),
+                          PObject.standardizedList( [0, PObject( 0, "F" )] ) )
+
+
+    def test_mixedUnitsRaise( self ):
+        for polist in ([PObject( "1 kΩ" ), PObject( "2.2 nF" )],
+                       [0, PObject( "10 mA" ), PObject( "1 V" )],
+                       [PObject( "1 kΩ" ), 1000]):
+            with self.assertRaises( ValueError ):
+                PObject.standardizedList( polist )
+
+
+class TestImperialLengthMisfits( unittest.TestCase ):
+
+    def assertRoundTrip( self, valstr, expected, **kwargs ):
+        obj = ImperialLengthMisfits( valstr, **kwargs )
+        self.assertEqual( expected, str( obj ) )
+        again = ImperialLengthMisfits( expected, **kwargs )
+        self.assertEqual( expected, str( again ) )
+        self.assertAlmostEqual( obj.value, again.value, places=12 )
+
+
+    def test_fractionsAreCanceled( self ):
+        for valstr, expected in (("5 ft 3 1/2 in", "5 ft 3 1/2 in"),
+                                 ("5 ft 3 32/64 in", "5 ft 3 1/2 in"),
+                                 ("5 ft 3 12/16 in", "5 ft 3 3/4 in"),
+                                 ("5 ft 3 17/32 in", "5 ft 3 17/32 in"),
+                                 ("3/8 in", "0 3/8 in"),
+                                 ("0.5 in", "0 1/2 in")):
+            self.assertRoundTrip( valstr, expected )
+        self.assertRoundTrip( "1 2/8 in", "1 1/4 in", precision=1/8 )
+
+
+    def test_parseNumberUnitPairs( self ):
+        for valstr in ("5 ft 3 1/2 in", "5 ft 3 1/2 in  ", "  5 ft 3 1/2 in",
+                       "5 FT. 3 1/2 INCHES", "5' 3 1/2\"", "5 ft 3 1/2\"",
+                       "63 1/2 in", "5 ft 3.5 in"):
+            self.assertRoundTrip( valstr, "5 ft 3 1/2 in" )
+        for valstr, expected in (("7 in", "7 in"),
+                                 ("1/2 in", "0 1/2 in"),
+                                 ("1 mi", "1 mi"),
+                                 ("3 mil", "3.00 mil")):
+            self.assertRoundTrip( valstr, expected )
+
+
+    def test_malformedStringRaises( self ):
+        for valstr in ("5 ft 3 1/2", "5 furlongs", "x ft"):
+            with self.assertRaises( ValueError ):
+                ImperialLengthMisfits( valstr )
+
+
+    def test_breakdownIntoLargerUnits( self ):
+        for valstr, expected in (("63 in", "5 ft 3 in"),
+                                 ("1 yd 1/4 in", "3 ft 0 1/4 in"),
+                                 ("2 mi 100 yd 2 ft 7 3/4 in",
+                                  "2 mi 302 ft 7 3/4 in"),
+                                 ("5 ft 11 31/32 in", "5 ft 11 31/32 in"),
+                                 ("5 ft 12 in", "6 ft")):
+            self.assertRoundTrip( valstr, expected )
+        for valstr, expected in (("5 ft 7 in", "1 yd 2 ft 7 in"),
+                                 ("2 mi 100 yd 2 ft 7 3/4 in",
+                                  "2 mi 100 yd 2 ft 7 3/4 in")):
+            self.assertRoundTrip( valstr, expected, useYards=True )
+        self.assertRoundTrip( "5 ft 3.25 in", "5 ft 3.25 in", precision=0.01 )
+
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,99 @@
+# Python Implementation: test_SI
+# -*- coding: utf-8 -*-
+##
+# @file       test_SI.py
+#
+# @par Purpose
+#             Unit Tests for the SI module of the PObjects package.
+#
+# @par Comments
+#             Like all Unit Tests of this package, this script expects to
+#             reside in the package directory PObjects and is run by
+#             "make check".
+#
+# @par
+#             This is Python 3 code!
+
+import os
+import sys
+import unittest
+
+# the directory containing the package directory PObjects
+sys.path.insert( 0, os.path.dirname( os.path.dirname(
+                                            os.path.abspath( __file__ ) ) ) )
+from PObjects import SI
+
+
+class TestUnit( unittest.TestCase ):
+
+    def test_componentsOfCompositeUnits( self ):
+        self.assertEqual( "m**2 kg / s", str( SI.Unit( (12, 5) ) ) )
+        self.assertEqual( "kg**2 / s**4", str( SI.Unit( (9, 625) ) ) )
+        self.assertEqual( "m**2 mol / K", str( SI.Unit( (52, 11) ) ) )
+
+
+    def test_leftoverFactorRaises( self ):
+        for unitTuple in ((19, 1), (2 * 19, 5), (2, 23 * 5)):
+            with self.assertRaises( ValueError ):
+                str( SI.Unit( unitTuple ) )
+
+
+    def test_integerPowers( self ):
+        m = SI.Unit( "m" )
+        self.assertEqual( SI.Unit( (1, 1) ), m**0 )
+        self.assertIs( m, m**1 )
+        self.assertEqual( SI.Unit( "m**2" ), m**2 )
+        self.assertEqual( SI.Unit( "m**2" ), m**2.0 )
+        self.assertEqual( SI.Unit( (1, 2) ), m**-1 )
+        self.assertEqual( SI.Unit( (1, 2) ), m**-1.0 )
+        self.assertEqual( SI.Unit( (1, 4) ), m**-2 )
+
+
+    def test_squareRoots( self ):
+        self.assertEqual( SI.Unit( "m" ), SI.Unit( "m**2" )**0.5 )
+        self.assertEqual( SI.Unit( (1, 2) ), SI.Unit( "m**2" )**-0.5 )
+        for power in (0.5, -0.5):
+            with self.assertRaises( ValueError ):
+                SI.Unit( "m" )**power
+
+
+    def test_equality( self ):
+        volt = SI.Unit( "V" )
+        self.assertTrue( volt == volt )
+        self.assertTrue( volt == SI.Unit( "W" ) / SI.Unit( "A" ) )
+        self.assertTrue( volt == "V" )
+        self.assertFalse( volt != "V" )
+        self.assertTrue( volt != "A" )
+        self.assertFalse( volt == SI.Unit( "A" ) )
+        for other in (1, 1.0, None):
+            with self.assertRaises( ValueError ):
+                volt == other
+            with self.assertRaises( ValueError ):
+                volt != other
+
+
+class TestPrefix( unittest.TestCase ):
+
+    def test_normalizeListMatchesNormalizeTuple( self ):
+        values = [1, 2.5, 0, -4.7]
+        for unit in ("kΩ", "mg", "g", "MHz", "μF", " nA ", SI.Unit( "V" )):
+            expected = [SI.Prefix.normalizeTuple( (value, unit) )
+                        for value in values]
+            result, baseUnit = SI.Prefix.normalizeList( values, unit )
+            self.assertEqual( [value for value, _ in expected], result )
+            self.assertEqual( expected[0][1], baseUnit )
+        self.assertEqual( ([1e-6], "F"),
+                          SI.Prefix.normalizeList( [1], "uF",
+                                                   strictAscii=True ) )
+        self.assertEqual( ([], "Ω"), SI.Prefix.normalizeList( [], "kΩ" ) )
+
+
+    def test_normalizeListWrongTypesRaise( self ):
+        for values, unit in (([1], 3), (["1"], "m"), ([1j], "m")):
+            with self.assertRaises( ValueError ):
+                SI.Prefix.normalizeList( values, unit )
+
+
+
+if "__main__" == __name__:
+    unittest.main()